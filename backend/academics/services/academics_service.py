@@ -6,7 +6,7 @@ import logging
 from django.db import transaction
 from academics.models import SchoolAcademicYear
 
-from school.models import SchoolDbMetadata
+from core.common_modules.common_functions import CommonFunctions
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -24,7 +24,7 @@ class AcademicsService:
                 logger.error("School ID is required for fetching academic years.")
                 return Response({"error": "School ID is required."},
                                 status=status.HTTP_400_BAD_REQUEST)
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
             if not school_db_name:
                 logger.error(f"School with ID {school_id} does not exist.")
                 return Response({"error": "School not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -57,7 +57,7 @@ class AcademicsService:
                 return Response({"error": "School ID, start year, and end year are required."},
                                 status=status.HTTP_400_BAD_REQUEST)
 
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
 
             if not school_db_name:
                 logger.error("School with ID %s does not exist.", school_id)
@@ -95,7 +95,7 @@ class AcademicsService:
                     {"error":"School ID, academic year ID, start year, and end year are required."},
                                 status=status.HTTP_400_BAD_REQUEST)
 
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
 
             if not school_db_name:
                 logger.error("School with ID %s does not exist.", school_id)
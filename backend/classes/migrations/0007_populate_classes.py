@@ -1,11 +1,10 @@
 # Generated by Django 5.2.3 on 2025-07-13 19:02
-from django.conf import settings
 from django.db import migrations
 from django.core.management import call_command
 
 def load_fixture(apps, schema_editor):
     
-    db_name = getattr(settings, 'CURRENT_MIGRATION_DB', 'default')
+    db_name = schema_editor.connection.alias
 
     fixtures = ['classes.json']
     for fixture in fixtures:
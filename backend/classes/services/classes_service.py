@@ -4,6 +4,7 @@ import logging
 
 from django.http import JsonResponse
 from django.db import IntegrityError,transaction
+from django.db.models import Count, OuterRef, Q, Subquery
 
 from classes.models import SchoolClass,ClassAssignment,SchoolSection
 
@@ -12,19 +13,15 @@ from academics.models import SchoolAcademicYear
 
 from core.common_modules.common_functions import CommonFunctions
 from core.models import User
+from core.common_modules.user_directory import UserDirectory
+from core.common_modules.pagination import KeysetPaginator, InvalidCursor
 
 from school.models import SchoolDefaultClasses,SchoolBoard
 
 from student.models import StudentClassAssignment,Student
 from student.services.student_service import StudentService
 
-from syllabus.models import (
-    SchoolChapter,
-    SchoolPrerequisite,
-    SchoolSubTopic,
-    SchoolClassSubTopic,
-    SchoolClassPrerequisite
-)
+from school.services.school_stats_service import SchoolStatsService
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +47,29 @@ class ClassesService:
             return JsonResponse({"error": "An error occurred while retrieving classes."},
                                 status=500)
     @staticmethod
+    def get_class_overview(school_db_name, academic_year_id):
+        """
+        Class assignments of an academic year with their section and class teacher,
+        annotated with the number of active students, as a single query.
+        Only the first assignment of a section is kept if it has several.
+        """
+        first_assignment = ClassAssignment.objects.using(school_db_name).filter(
+            academic_year_id=academic_year_id,
+            class_instance_id=OuterRef('class_instance_id'),
+        ).order_by('id').values('id')[:1]
+        enrollments = Q(
+            class_instance__studentclassassignment__academic_year_id=academic_year_id,
+            class_instance__studentclassassignment__student__is_active=True,
+        )
+        return ClassAssignment.objects.using(school_db_name).filter(
+            academic_year_id=academic_year_id,
+            id=Subquery(first_assignment),
+        ).select_related('class_instance', 'class_teacher').annotate(
+            student_count=Count('class_instance__studentclassassignment',
+                                filter=enrollments, distinct=True)
+        )
+
+    @staticmethod
     def get_classes_by_school_id(request):
         try:
             logger.info("Retrieving active classes.")
@@ -65,69 +85,57 @@ class ClassesService:
             
             school_db_name = CommonFunctions.get_school_db_name(school_id)
 
-            classes = SchoolSection.objects.using(school_db_name).all()
+            class_assignments = ClassesService.get_class_overview(school_db_name, academic_year_id)
+            if request.GET.get('board_id'):
+                class_assignments = class_assignments.filter(
+                    class_instance__board_id=request.GET.get('board_id'))
+            if request.GET.get('class_number'):
+                class_assignments = class_assignments.filter(
+                    class_instance__class_instance_id=request.GET.get('class_number'))
+
+            paginator = KeysetPaginator.from_request(request, ordering=('class_instance_id', 'id'))
+            class_assignments, next_cursor = paginator.paginate(class_assignments)
+
+            user_directory = UserDirectory.current()
+            user_directory.prefetch(assignment.class_teacher.teacher_id
+                                    for assignment in class_assignments
+                                    if assignment.class_teacher)
+            school_boards = SchoolBoard.objects.in_bulk(
+                {assignment.class_instance.board_id for assignment in class_assignments}
+            )
 
             data = []
-            for class_obj in classes:
-                school_board = SchoolBoard.objects.using(school_db_name).get(
-                    id=class_obj.board_id
-                )
-                class_instance = ClassAssignment.objects.using(school_db_name).filter(
-                    class_instance=class_obj,
-                    academic_year_id=academic_year_id
-                ).first()
-                teacher = None
+            for class_instance in class_assignments:
+                class_obj = class_instance.class_instance
+                teacher = class_instance.class_teacher
                 teacher_name = None
-                student_count = 0
-                if class_instance:
-                    try:
-                        class_teacher_id = class_instance.class_teacher_id
-                        if class_teacher_id:
-                            teacher = Teacher.objects.using(school_db_name).get(pk=class_teacher_id)
-                            teacher_name = User.objects.get(
-                                id=teacher.teacher_id,
-                                is_active=True,
-                            ).full_name()
-                    except Teacher.DoesNotExist:
-                        logger.error(f"Teacher with ID {class_instance.class_teacher_id} does not exist.")
-                        continue
-                    except User.DoesNotExist:
+                if teacher:
+                    user = user_directory.get(teacher.teacher_id)
+                    if user is None or not user.is_active:
                         logger.error(f"Teacher with ID {teacher.teacher_id} does not exist.")
                         continue
-
-                    academic_year_obj = SchoolAcademicYear.objects.using(school_db_name).get(
-                        pk=class_instance.academic_year_id)
-
-                    student_ids = StudentClassAssignment.objects.using(school_db_name).filter(
-                        class_instance=class_instance.class_instance_id,
-                        academic_year=academic_year_obj
-                    ).values_list('student_id', flat=True)
-
-                    student_count = Student.objects.using(school_db_name).filter(
-                        id__in=student_ids,
-                        is_active=True
-                    ).count()
-
-                    class_data = {
-                        'class_assignment_id': class_instance.id if class_instance else None,
-                        'class_id': class_obj.id,
-                        'class_number': class_obj.class_instance_id,
-                        'section': class_obj.section,
-                        'teacher_id': teacher.teacher_id if teacher else None,
-                        'teacher_name': teacher_name,
-                        # 'academic_year_id': academic_year_obj.id,
-                        # 'academic_year_start_date': str(academic_year_obj.start_date),
-                        # 'academic_year_end_date': str(academic_year_obj.end_date),
-                        'school_id': school_id,
-                        'student_count': student_count,
-                        'school_board_id': school_board.id,
-                        'school_board_name': school_board.board_name,
-                    }
-                    data.append(class_data)
+                    teacher_name = user.full_name()
+
+                school_board = school_boards.get(class_obj.board_id)
+                class_data = {
+                    'class_assignment_id': class_instance.id,
+                    'class_id': class_obj.id,
+                    'class_number': class_obj.class_instance_id,
+                    'section': class_obj.section,
+                    'teacher_id': teacher.teacher_id if teacher else None,
+                    'teacher_name': teacher_name,
+                    'school_id': school_id,
+                    'student_count': class_instance.student_count,
+                    'school_board_id': school_board.id if school_board else None,
+                    'school_board_name': school_board.board_name if school_board else None,
+                }
+                data.append(class_data)
 
 
             logger.info(f"Retrieved {len(data)} active classes.")
-            return JsonResponse({'classes': data}, status=200)
+            return JsonResponse({'classes': data, 'next_cursor': next_cursor}, status=200)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
         except Exception as e:
             logger.error(f"Error retrieving active classes: {e}")
             return JsonResponse({"error": "An error occurred while retrieving active classes."},
@@ -153,9 +161,7 @@ class ClassesService:
             
             class_obj = SchoolSection.objects.using(school_db_name).get(
                     pk=class_id)
-            school_board = SchoolBoard.objects.using(school_db_name).get(
-                id=class_obj.board_id
-            )
+            school_board = SchoolBoard.objects.get(id=class_obj.board_id)
             class_instance = ClassAssignment.objects.using(school_db_name).filter(
                 class_instance=class_obj,
                 academic_year_id=academic_year_id
@@ -164,10 +170,10 @@ class ClassesService:
             teacher_name = None
             if class_instance and class_instance.class_teacher_id:
                 teacher = Teacher.objects.using(school_db_name).get(pk=class_instance.class_teacher_id)
-                teacher_name = User.objects.get(
-                    id=teacher.teacher_id,
-                    is_active=True,
-                ).full_name()
+                user = UserDirectory.current().get(teacher.teacher_id)
+                if user is None or not user.is_active:
+                    raise User.DoesNotExist
+                teacher_name = user.full_name()
 
             academic_year = SchoolAcademicYear.objects.using(school_db_name).get(
                 id = academic_year_id
@@ -176,7 +182,7 @@ class ClassesService:
             student_ids = StudentClassAssignment.objects.using(school_db_name).filter(
                 class_instance = class_obj,
                 academic_year = academic_year
-            )
+            ).values_list('student_id', flat=True)
 
             students = Student.objects.using(school_db_name).filter(
                 id__in=student_ids,
@@ -266,43 +272,6 @@ class ClassesService:
                     academic_year=academic_year
                 )
 
-                chapters = SchoolChapter.objects.using(school_db_name).filter(
-                    class_number=class_obj,
-                    academic_year=academic_year,
-                    school_board_id=board_id
-                )
-                if chapters.exists():
-                    for chapter in chapters:
-                        subtopics = SchoolSubTopic.objects.using(school_db_name).filter(chapter=chapter)
-                        class_subtopic_objs = [
-                            SchoolClassSubTopic(
-                                chapter=chapter,
-                                name=subtopic.name,
-                                class_section=class_instance
-                            )
-                            for subtopic in subtopics
-                        ]
-                        if class_subtopic_objs:
-                            SchoolClassSubTopic.objects.using(school_db_name).bulk_create(
-                                class_subtopic_objs
-                            )
-
-                        prerequisites = SchoolPrerequisite.objects.using(school_db_name).filter(
-                            chapter=chapter
-                        )
-                        class_prerequisite_objs = [
-                            SchoolClassPrerequisite(
-                                chapter=chapter,
-                                class_section=class_instance,
-                                topic=prerequisite.topic,
-                                explanation=prerequisite.explanation
-                            )
-                            for prerequisite in prerequisites
-                        ]
-                        if class_prerequisite_objs:
-                            SchoolClassPrerequisite.objects.using(school_db_name).bulk_create(
-                                class_prerequisite_objs
-                            )
                 if not created:
                     return JsonResponse({
                         'error': 'A class assignment with the same class, teacher, and academic year already exists.'
@@ -345,6 +314,81 @@ class ClassesService:
             return JsonResponse({"error": "An error occurred while creating the class."},
                                 status=500)
     
+    @staticmethod
+    def create_sections(request):
+        """
+        Create several sections of a class at once, each with its class assignment.
+        Sections read the shared class syllabus (see ClasswiseSyllabusResolver).
+        """
+        try:
+            school_id = request.data.get("school_id") or getattr(request.user, 'school_id', None)
+            class_number = request.data.get('class_number')
+            section_names = request.data.get('sections') or []
+            board_id = request.data.get('board_id', None)
+            academic_year_id = request.data.get('academic_year_id',1)
+
+            if not school_id or not class_number or not section_names or not board_id or not academic_year_id:
+                return JsonResponse({"error": "Required fields are missing."},
+                                    status=400)
+            if len(set(section_names)) != len(section_names):
+                return JsonResponse({"error": "Section names must be unique."},
+                                    status=400)
+
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
+            if not school_db_name:
+                return JsonResponse({"error": "School not found or inactive."},
+                                    status=404)
+
+            academic_year = SchoolAcademicYear.objects.using(school_db_name).filter(
+                                id=academic_year_id).first()
+            if not academic_year:
+                return JsonResponse({"error": "Academic Year not found."},
+                                    status=404)
+            with transaction.atomic(using=school_db_name):
+                class_obj = SchoolClass.objects.using(school_db_name).get(
+                    class_number=class_number,
+                )
+                sections = SchoolSection.objects.using(school_db_name).bulk_create([
+                    SchoolSection(class_instance=class_obj, section=section_name, board_id=board_id)
+                    for section_name in section_names
+                ])
+                class_assignments = ClassAssignment.objects.using(school_db_name).bulk_create([
+                    ClassAssignment(class_instance=section, academic_year=academic_year)
+                    for section in sections
+                ])
+                # bulk_create skips the post_save signals that keep the stats current
+                SchoolStatsService().refresh_sections(school_db_name)
+
+            response_data = [
+                {
+                    'id': class_assignment.id,
+                    'class_id': section.id,
+                    'class_number': class_obj.class_number,
+                    'section': section.section,
+                    'teacher_id': None,
+                    'academic_year_id': academic_year.id
+                }
+                for section, class_assignment in zip(sections, class_assignments)
+            ]
+            logger.info(f"{len(sections)} sections of class {class_number} created successfully.")
+            return JsonResponse({'classes': response_data}, status=201)
+        except SchoolClass.DoesNotExist:
+            logger.error("Class does not exist.")
+            return JsonResponse({"error": "Class not found."}, status=404)
+        except IntegrityError as e:
+            logger.error(f"Integrity error while creating sections: {e}")
+            if 'unique_class_instance_section' in str(e):
+                return JsonResponse({
+                    'error': 'A class with the same class number and section already exists.'
+                }, status=400)
+            return JsonResponse({
+                'error': 'An unexpected error occurred while creating the sections.'
+            }, status=500)
+        except Exception as e:
+            logger.error(f"Error creating sections: {e}")
+            return JsonResponse({"error": "An error occurred while creating the sections."},
+                                status=500)
+
     @staticmethod
     def update_class(request):
         """Update an existing class."""
@@ -42,6 +42,8 @@ class ClassesManagingView(APIView):
         #     return ClassesService().create_class_and_section(request)
         if action == 'createClass':
             return ClassesService().create_class(request)
+        elif action == 'createSections':
+            return ClassesService().create_sections(request)
         else:
             return Response({"error": "Invalid POST action"}, status=status.HTTP_400_BAD_REQUEST)
 
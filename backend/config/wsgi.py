@@ -15,3 +15,7 @@ environment = os.environ.get('ENVIRONMENT', 'dev')
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'settings.{environment}')
 
 application = get_wsgi_application()
+
+from core.common_modules.tenant_registry import TenantRegistry
+
+TenantRegistry.warm()
@@ -1,5 +1,22 @@
+
 from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from django.core.signals import request_started, request_finished
+        from django.db.backends.signals import connection_created
+
+        from core.common_modules.db_loader import DbLoader
+        from core.common_modules.tenant_connections import TenantConnectionManager
+
+        connection_created.connect(DbLoader.on_connection_created,
+                                   dispatch_uid='tenant_schema_connection_created')
+        connection_created.connect(TenantConnectionManager.on_connection_created,
+                                   dispatch_uid='tenant_connection_created')
+        request_started.connect(TenantConnectionManager.on_request_started,
+                                dispatch_uid='tenant_request_started')
+        request_finished.connect(TenantConnectionManager.on_request_finished,
+                                 dispatch_uid='tenant_request_finished')
@@ -6,6 +6,7 @@ from typing import Optional, List
 import mimetypes
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from botocore.client import Config
 
@@ -23,7 +24,15 @@ class AwsS3Bucket:
             region_name=settings.AWS_CONFIG['REGION_NAME'],
             aws_access_key_id=settings.AWS_CONFIG['AWS_ACCESS_KEY_ID'],
             aws_secret_access_key=settings.AWS_CONFIG['AWS_SECRET_ACCESS_KEY'],
-            config=Config(signature_version='s3v4')
+            config=Config(signature_version='s3v4',
+                          max_pool_connections=settings.AWS_CONFIG['MAX_CONCURRENCY'])
+        )
+        # Large files go up as concurrent multipart uploads, one part in memory per thread
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.AWS_CONFIG['MULTIPART_THRESHOLD_MB'] * 1024 * 1024,
+            multipart_chunksize=settings.AWS_CONFIG['MULTIPART_CHUNK_SIZE_MB'] * 1024 * 1024,
+            max_concurrency=settings.AWS_CONFIG['MAX_CONCURRENCY'],
+            use_threads=True,
         )
 
     def upload_file(self, file, s3_key: str, file_type = None) -> bool:
@@ -36,7 +45,8 @@ class AwsS3Bucket:
                 ExtraArgs={
                     'ContentType': file_type,
                     'ContentDisposition': 'inline'
-                }
+                },
+                Config=self.transfer_config
             )
             logger.info("File uploaded successfully to S3: %s", s3_key)
             return True
@@ -68,7 +78,8 @@ class AwsS3Bucket:
 
     def download_file(self, s3_key: str, file_path: str) -> bool:
         try:
-            self.s3.download_file(self.bucket_name, s3_key, file_path)
+            self.s3.download_file(self.bucket_name, s3_key, file_path,
+                                  Config=self.transfer_config)
             logger.info("File downloaded successfully from S3: %s", s3_key)
             return True
         except ClientError as e:
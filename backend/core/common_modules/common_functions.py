@@ -2,9 +2,9 @@
 
 import logging
 
-import PyPDF2
-
-from school.models import SchoolDbMetadata
+from core.common_modules.db_loader import DbLoader
+from core.common_modules.pdf_text_extractor import PdfTextExtractor
+from core.common_modules.tenant_registry import TenantRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -14,24 +14,22 @@ class CommonFunctions:
     def get_school_db_name(school_id):
         """Retrieve the database name for a given school ID."""
         try:
-            school_metadata = SchoolDbMetadata.objects.get(school_id=school_id,is_active=True)
-            return school_metadata.db_name
-        except SchoolDbMetadata.DoesNotExist:
-            logger.error(f"School metadata not found for school ID: {school_id}")
-            return None
+            school_db_name = TenantRegistry.get_db_name(school_id)
+            if not school_db_name:
+                logger.error(f"School metadata not found for school ID: {school_id}")
+                return None
+            return DbLoader().register_school_database(school_db_name)
         except Exception as e:
             logger.error(f"Error retrieving school database name: {e}")
             return None
     
     @staticmethod
-    def extract_text_from_pdf(pdf_file):
-        pdf_file.seek(0)
-        pdf_text = ""
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        num_pages = len(pdf_reader.pages)
+    def extract_pages_from_pdf(pdf_file):
+        """Return the text of every page of a PDF, in order."""
+        return PdfTextExtractor().extract_pages(pdf_file)
 
-        for page_num in range(num_pages):
-            page = pdf_reader.pages[page_num]
-            page_text = page.extract_text()
-            pdf_text += (page_text or "") + "\n\n"
-        return pdf_text
\ No newline at end of file
+    @staticmethod
+    def extract_text_from_pdf(pdf_file):
+        return "".join(
+            page_text + "\n\n" for page_text in CommonFunctions.extract_pages_from_pdf(pdf_file)
+        )
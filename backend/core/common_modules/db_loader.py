@@ -1,13 +1,16 @@
 """Db loader module for managing school databases."""
 
 import logging
+import threading
 
 from django.conf import settings
-
-from school.models import SchoolDbMetadata
+from django.db import connections
 
 logger = logging.getLogger(__name__)
 
+# Guards registration so concurrent requests don't race on settings.DATABASES
+_registration_lock = threading.Lock()
+
 class DbLoader:
     """Class to handle loading and managing school databases."""
 
@@ -15,39 +18,101 @@ class DbLoader:
         pass
 
     def load_dynamic_databases(self,db_key,engine,name,user,password,host,port):
-        """Load all dynamic databases from the SchoolDbMetadata model."""
+        """Register a single school database alias with Django."""
         try:
-            if db_key not in settings.DATABASES:
-                settings.DATABASES[db_key] = {
-                    'ENGINE': engine,
-                    'NAME': name,
-                    'USER': user,
-                    'PASSWORD': password,
-                    'HOST': host,
-                    'PORT': port,
-                    'ATOMIC_REQUESTS': False,
-                    'OPTIONS': {},
-                    'CONN_MAX_AGE': 300,
-                    'TIME_ZONE': settings.TIME_ZONE,
-                    'CONN_HEALTH_CHECKS': True,
-                    'AUTOCOMMIT': True,
-                }
-            else:
-                logger.info(f"Database {db_key} already exists in settings.DATABASES")
+            with _registration_lock:
+                if db_key not in connections.settings:
+                    db_settings = {
+                        'ENGINE': engine,
+                        'NAME': name,
+                        'USER': user,
+                        'PASSWORD': password,
+                        'HOST': host,
+                        'PORT': port,
+                        'ATOMIC_REQUESTS': False,
+                        'OPTIONS': {},
+                        'CONN_MAX_AGE': settings.TENANT_DB_CONFIG['CONN_MAX_AGE'],
+                        'TIME_ZONE': settings.TIME_ZONE,
+                        'CONN_HEALTH_CHECKS': True,
+                        'AUTOCOMMIT': True,
+                        'TEST': {
+                            'CHARSET': None,
+                            'COLLATION': None,
+                            'MIGRATE': True,
+                            'MIRROR': None,
+                            'NAME': None,
+                        },
+                    }
+                    settings.DATABASES[db_key] = db_settings
+                    # The connection handler caches its own view of DATABASES
+                    connections.settings[db_key] = db_settings
+                    logger.info(f"Registered database {db_key}")
+                else:
+                    logger.debug(f"Database {db_key} already exists in settings.DATABASES")
         except Exception as e:
             logger.error(f"Error loading database {db_key}: {e}")
             raise e
-    
-    def load_databases(self):
-        for school_db in SchoolDbMetadata.objects.all():
-            db_key = school_db.db_name
-            if db_key not in settings.DATABASES:
+
+    @staticmethod
+    def is_schema_mode():
+        """True when every school lives in its own schema of the default database."""
+        return settings.TENANT_DB_CONFIG['ISOLATION_MODE'] == 'schema'
+
+    def register_school_database(self, db_name):
+        """
+        Register a school database on first use and return the alias to query it with.
+        Cheap no-op once the alias is known to this worker.
+
+        In schema mode `db_name` is the school's schema: every school shares one
+        pooled alias and the schema is selected through search_path.
+        """
+        if self.is_schema_mode():
+            alias = settings.TENANT_DB_CONFIG['SCHEMA_ALIAS']
+            if alias not in connections.settings:
                 self.load_dynamic_databases(
-                    db_key = db_key,
+                    db_key = alias,
                     engine = settings.DB_CONFIG['ENGINE'],
-                    name = school_db.db_name,
+                    name = settings.DB_CONFIG['NAME'],
                     user = settings.DB_CONFIG['USER'],
                     password = settings.DB_CONFIG['PASSWORD'],
                     host = settings.DB_CONFIG['HOST'],
                     port = settings.DB_CONFIG['PORT']
-                )
\ No newline at end of file
+                )
+            self.activate_schema(alias, db_name)
+            return alias
+
+        if db_name not in connections.settings:
+            self.load_dynamic_databases(
+                db_key = db_name,
+                engine = settings.DB_CONFIG['ENGINE'],
+                name = db_name,
+                user = settings.DB_CONFIG['USER'],
+                password = settings.DB_CONFIG['PASSWORD'],
+                host = settings.DB_CONFIG['HOST'],
+                port = settings.DB_CONFIG['PORT']
+            )
+        return db_name
+
+    def activate_schema(self, alias, schema):
+        """Point this thread's connection for `alias` at a school's schema."""
+        connection = connections[alias]
+        connection.tenant_schema = schema
+        if (connection.connection is not None
+                and getattr(connection, 'applied_tenant_schema', None) != schema):
+            self.apply_search_path(connection)
+
+    @staticmethod
+    def apply_search_path(connection):
+        schema = getattr(connection, 'tenant_schema', None)
+        if not schema:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET search_path TO {connection.ops.quote_name(schema)}")
+        connection.applied_tenant_schema = schema
+
+    @classmethod
+    def on_connection_created(cls, sender, connection, **kwargs):
+        """Re-apply the active schema whenever a pooled connection is (re)opened."""
+        connection.applied_tenant_schema = None
+        if getattr(connection, 'tenant_schema', None):
+            cls.apply_search_path(connection)
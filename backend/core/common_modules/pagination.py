@@ -0,0 +1,114 @@
+"""Pagination module for keyset (cursor) pagination of list endpoints."""
+
+import base64
+import json
+import logging
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor this paginator did not issue."""
+
+
+class KeysetPaginator:
+    """
+    Keyset pagination over a queryset with a stable ordering.
+
+    Instead of OFFSET, each page starts right after the last row of the
+    previous one (`WHERE (ordering) > (last values)`), so every page costs the
+    same whatever its depth and rows inserted meanwhile don't shift pages.
+    The last ordering field must be unique (the primary key by default).
+
+    Cursors are opaque to clients: base64 encoded JSON of the last row's
+    ordering values, returned as `next_cursor` (None on the last page).
+
+    Pagination is opt-in for endpoints that used to return full lists: a
+    request with neither `cursor` nor `page_size` gets every row, so existing
+    clients keep working.
+
+    Usage:
+        paginator = KeysetPaginator.from_request(request, ordering=('id',))
+        rows, next_cursor = paginator.paginate(queryset)
+    """
+
+    def __init__(self, ordering=('id',), page_size=None, cursor=None, unbounded=False):
+        self.ordering = tuple(ordering)
+        max_page_size = settings.PAGINATION_CONFIG['MAX_PAGE_SIZE']
+        page_size = page_size or settings.PAGINATION_CONFIG['DEFAULT_PAGE_SIZE']
+        self.page_size = max(1, min(int(page_size), max_page_size))
+        self.cursor = cursor
+        self.unbounded = unbounded and not cursor
+
+    @classmethod
+    def from_request(cls, request, ordering=('id',), default_page_size=None):
+        """
+        Build a paginator from the `cursor` and `page_size` query parameters.
+        Without either, the paginator returns the whole queryset.
+        """
+        requested_page_size = request.GET.get('page_size')
+        cursor = request.GET.get('cursor')
+        try:
+            page_size = int(requested_page_size or default_page_size or 0) or None
+        except ValueError:
+            raise InvalidCursor("page_size must be a number.")
+        return cls(ordering=ordering, page_size=page_size, cursor=cursor,
+                   unbounded=not (cursor or requested_page_size))
+
+    def paginate(self, queryset):
+        """
+        Return one page of `queryset` and the cursor of the next page.
+        Returns:
+            tuple: (list of rows, next cursor or None)
+        """
+        queryset = queryset.order_by(*self.ordering)
+        if self.unbounded:
+            return list(queryset), None
+        if self.cursor:
+            queryset = queryset.filter(self._after(self.decode(self.cursor)))
+
+        rows = list(queryset[:self.page_size + 1])
+        if len(rows) <= self.page_size:
+            return rows, None
+        rows = rows[:self.page_size]
+        return rows, self.encode(rows[-1])
+
+    def _after(self, values):
+        """Build `(f1, f2, ...) > (v1, v2, ...)` honouring per-field direction."""
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            step = Q(**{f"{name}__{lookup}": values[index]})
+            for previous_field, previous_value in zip(self.ordering[:index], values[:index]):
+                step &= Q(**{previous_field.lstrip('-'): previous_value})
+            condition |= step
+        return condition
+
+    def encode(self, row):
+        values = [self._value(row, field.lstrip('-')) for field in self.ordering]
+        payload = json.dumps(values, cls=DjangoJSONEncoder).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    def decode(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid pagination cursor {cursor}: {e}")
+            raise InvalidCursor("Invalid cursor.")
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor("Invalid cursor.")
+        return values
+
+    @staticmethod
+    def _value(row, field):
+        if isinstance(row, dict):
+            return row[field]
+        value = row
+        for part in field.split('__'):
+            value = getattr(value, part)
+        return value
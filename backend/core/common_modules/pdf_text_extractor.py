@@ -0,0 +1,170 @@
+"""PDF text extraction module: page ranges parsed in parallel by a pluggable parser."""
+
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PyPdf2Parser:
+    """Pure-Python parser; always available."""
+
+    @staticmethod
+    def open(source):
+        import PyPDF2
+        return PyPDF2.PdfReader(source)
+
+    @staticmethod
+    def page_count(document):
+        return len(document.pages)
+
+    @staticmethod
+    def page_text(document, index):
+        return document.pages[index].extract_text() or ""
+
+
+class PypdfParser(PyPdf2Parser):
+    """pypdf, the maintained successor of PyPDF2 (optional dependency)."""
+
+    @staticmethod
+    def open(source):
+        import pypdf
+        return pypdf.PdfReader(source)
+
+
+class PyMuPdfParser:
+    """PyMuPDF (fitz), a C parser several times faster than PyPDF2 (optional dependency)."""
+
+    @staticmethod
+    def open(source):
+        import fitz
+        if isinstance(source, str):
+            return fitz.open(source)
+        return fitz.open(stream=source.read(), filetype='pdf')
+
+    @staticmethod
+    def page_count(document):
+        return document.page_count
+
+    @staticmethod
+    def page_text(document, index):
+        return document[index].get_text() or ""
+
+
+PARSERS = {
+    'pypdf2': PyPdf2Parser,
+    'pypdf': PypdfParser,
+    'pymupdf': PyMuPdfParser,
+}
+
+
+def _open(parser_name, source):
+    """Open a PDF given as a file path or as bytes."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return PARSERS[parser_name].open(source)
+
+
+def _extract_range(parser_name, source, start, stop):
+    """Worker entry point: return the texts of pages [start, stop)."""
+    parser = PARSERS[parser_name]
+    document = _open(parser_name, source)
+    return [parser.page_text(document, index) for index in range(start, stop)]
+
+
+class PdfTextExtractor:
+    """
+    Extract the text of every page of a PDF.
+
+    The parser is chosen with PDF_EXTRACTION_CONFIG['PARSER']. Documents with
+    at least MIN_PAGES_FOR_POOL pages are split into page ranges that are
+    parsed on a process pool shared by the worker, so large textbooks use
+    every core instead of one thread; page texts are joined once at the end.
+    Small documents, and any failure of the pool, fall back to parsing in
+    this process.
+
+    Usage:
+        pages = PdfTextExtractor().extract_pages(pdf_file)
+    """
+
+    _pool = None
+    _pool_lock = threading.Lock()
+
+    def __init__(self, parser=None, workers=None):
+        config = settings.PDF_EXTRACTION_CONFIG
+        self.parser_name = parser or config['PARSER']
+        if self.parser_name not in PARSERS:
+            raise ValueError(f"Unknown PDF parser '{self.parser_name}', "
+                             f"expected one of {', '.join(PARSERS)}.")
+        self.workers = workers or config['WORKERS'] or os.cpu_count() or 1
+        self.min_pages_for_pool = config['MIN_PAGES_FOR_POOL']
+
+    @classmethod
+    def get_pool(cls, workers):
+        """Return the process pool of this worker, started on first use."""
+        with cls._pool_lock:
+            if cls._pool is None:
+                # Spawned, not forked: the web and extraction workers are multi-threaded
+                cls._pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            return cls._pool
+
+    @classmethod
+    def shutdown_pool(cls):
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.shutdown(wait=False, cancel_futures=True)
+                cls._pool = None
+
+    def extract_pages(self, pdf_file):
+        """
+        Return the text of every page, in order.
+        Args:
+            pdf_file: A file path, bytes, or a binary file object.
+        """
+        source = self._source(pdf_file)
+        parser = PARSERS[self.parser_name]
+        document = _open(self.parser_name, source)
+        page_count = parser.page_count(document)
+
+        if self.workers <= 1 or page_count < self.min_pages_for_pool:
+            return [parser.page_text(document, index) for index in range(page_count)]
+
+        try:
+            return self._extract_in_pool(source, page_count)
+        except BrokenProcessPool as e:
+            logger.error(f"PDF extraction pool failed, parsing in process: {e}")
+            self.shutdown_pool()
+            return [parser.page_text(document, index) for index in range(page_count)]
+
+    def _extract_in_pool(self, source, page_count):
+        ranges_count = min(self.workers, page_count)
+        step = -(-page_count // ranges_count)
+        pool = self.get_pool(self.workers)
+        futures = [
+            pool.submit(_extract_range, self.parser_name, source, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+
+    @staticmethod
+    def _source(pdf_file):
+        """A path is passed to pool workers as is; file objects are read into bytes once."""
+        if isinstance(pdf_file, (str, bytes)):
+            return pdf_file
+        if hasattr(pdf_file, 'temporary_file_path'):
+            return pdf_file.temporary_file_path()
+        if isinstance(pdf_file, io.BufferedReader):
+            return pdf_file.name
+        pdf_file.seek(0)
+        return pdf_file.read()
@@ -0,0 +1,139 @@
+"""Tenant connection manager module for bounding open school database connections."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+
+class TenantConnectionManager:
+    """
+    Per-process budget for persistent tenant database connections.
+
+    Django keeps one connection per thread and per alias, so a threaded worker
+    that has served many schools can hold a connection to each of them. The
+    manager tracks every open tenant connection in least-recently-used order
+    and, once the configured budget is exceeded, closes the oldest idle ones.
+
+    Connections are thread-bound, so a connection owned by another thread is
+    only flagged here and closed by its owner at its next request boundary.
+    """
+
+    _lock = threading.Lock()
+    _open = OrderedDict()
+    _pending_evictions = defaultdict(set)
+    _evicted = defaultdict(set)
+    _counters = {'opened': 0, 'reopened': 0, 'evicted': 0}
+
+    @staticmethod
+    def is_tenant_alias(alias):
+        return alias != DEFAULT_DB_ALIAS
+
+    @classmethod
+    def on_connection_created(cls, sender, connection, **kwargs):
+        """Track a newly opened tenant connection."""
+        alias = connection.alias
+        if not cls.is_tenant_alias(alias):
+            return
+
+        key = (threading.get_ident(), alias)
+        with cls._lock:
+            cls._counters['opened'] += 1
+            if alias in cls._evicted[key[0]]:
+                cls._evicted[key[0]].discard(alias)
+                cls._counters['reopened'] += 1
+            cls._open[key] = time.monotonic()
+            cls._open.move_to_end(key)
+
+    @classmethod
+    def on_request_started(cls, sender=None, **kwargs):
+        cls._close_pending()
+
+    @classmethod
+    def on_request_finished(cls, sender=None, **kwargs):
+        """Refresh this thread's connections, then enforce the budget."""
+        thread_id = threading.get_ident()
+        now = time.monotonic()
+        with cls._lock:
+            for key in [key for key in cls._open if key[0] == thread_id]:
+                if connections[key[1]].connection is None:
+                    # Closed by Django itself (CONN_MAX_AGE, health check, error)
+                    del cls._open[key]
+                else:
+                    cls._open[key] = now
+                    cls._open.move_to_end(key)
+            cls._select_evictions()
+        cls._close_pending()
+
+    @classmethod
+    def _select_evictions(cls):
+        """Flag least-recently-used connections until the budget is respected."""
+        budget = settings.TENANT_DB_CONFIG['MAX_OPEN_CONNECTIONS']
+        alive = {thread.ident for thread in threading.enumerate()}
+        for key in [key for key in cls._open if key[0] not in alive]:
+            del cls._open[key]
+        for thread_id in [thread_id for thread_id in cls._evicted if thread_id not in alive]:
+            del cls._evicted[thread_id]
+        for thread_id in [thread_id for thread_id in cls._pending_evictions
+                          if thread_id not in alive]:
+            del cls._pending_evictions[thread_id]
+
+        pending = sum(len(aliases) for aliases in cls._pending_evictions.values())
+        excess = len(cls._open) - pending - budget
+        if excess <= 0:
+            return
+
+        for thread_id, alias in cls._open:
+            if excess <= 0:
+                break
+            if alias in cls._pending_evictions[thread_id]:
+                continue
+            cls._pending_evictions[thread_id].add(alias)
+            excess -= 1
+
+    @classmethod
+    def _close_pending(cls):
+        """Close the connections of the current thread that were flagged for eviction."""
+        thread_id = threading.get_ident()
+        with cls._lock:
+            aliases = cls._pending_evictions.pop(thread_id, set())
+        if not aliases:
+            return
+
+        closed = 0
+        for alias in aliases:
+            connection = connections[alias]
+            if connection.in_atomic_block:
+                continue
+            try:
+                if connection.connection is not None:
+                    connection.close()
+                    closed += 1
+            except Exception as e:
+                logger.error(f"Error closing tenant connection {alias}: {e}")
+                continue
+            with cls._lock:
+                cls._open.pop((thread_id, alias), None)
+                cls._evicted[thread_id].add(alias)
+
+        with cls._lock:
+            cls._counters['evicted'] += closed
+        logger.info("Evicted %s idle tenant connections. Stats: %s", closed, cls.stats())
+
+    @classmethod
+    def stats(cls):
+        """Return counters used to tune the connection budget."""
+        with cls._lock:
+            return {
+                'budget': settings.TENANT_DB_CONFIG['MAX_OPEN_CONNECTIONS'],
+                'open': len(cls._open),
+                'pending_evictions': sum(
+                    len(aliases) for aliases in cls._pending_evictions.values()
+                ),
+                **cls._counters,
+            }
@@ -0,0 +1,113 @@
+"""Tenant fan-out module for running a query across many school databases concurrently."""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import NamedTuple
+
+import psycopg2
+from django.conf import settings
+from django.db import connections
+
+from core.common_modules.db_loader import DbLoader
+
+logger = logging.getLogger(__name__)
+
+
+class FanoutResult(NamedTuple):
+    """Outcome of a fan-out, keyed by school id."""
+    results: dict
+    errors: dict
+    timed_out: list
+
+    @property
+    def is_partial(self):
+        return bool(self.errors or self.timed_out)
+
+
+class TenantFanout:
+    """
+    Run a per-tenant callable across many school databases on a bounded thread pool.
+
+    The callable receives the alias to query with and runs on a pool thread,
+    which owns its own connection per alias. Each tenant gets a statement
+    timeout on Postgres, and the whole fan-out is bounded by the same budget,
+    so one slow or unreachable school is reported instead of stalling the rest.
+
+    Usage:
+        outcome = TenantFanout().run(
+            lambda alias: Teacher.objects.using(alias).count(),
+            TenantRegistry.all(),
+        )
+    """
+
+    def __init__(self, max_workers=None, timeout=None):
+        self.max_workers = max_workers or settings.TENANT_DB_CONFIG['FANOUT_MAX_WORKERS']
+        self.timeout = timeout or settings.TENANT_DB_CONFIG['FANOUT_TIMEOUT_SECONDS']
+
+    def run(self, func, tenants):
+        """
+        Call `func(alias)` for every tenant.
+        Args:
+            func (callable): Per-tenant query; receives the registered alias.
+            tenants (iterable): TenantEntry items (see TenantRegistry).
+        Returns:
+            FanoutResult: Results and errors by school id, plus the schools that timed out.
+        """
+        tenants = list(tenants)
+        results, errors, timed_out = {}, {}, []
+        if not tenants:
+            return FanoutResult(results, errors, timed_out)
+
+        started = time.monotonic()
+        workers = min(self.max_workers, len(tenants))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tenant-fanout')
+        try:
+            futures = {
+                executor.submit(self._run_one, func, tenant.db_name): tenant.school_id
+                for tenant in tenants
+            }
+            # Queued tenants only start once a worker frees up, so allow one
+            # timeout per "wave" of workers before giving up on the stragglers
+            waves = -(-len(tenants) // workers)
+            done, not_done = wait(futures, timeout=self.timeout * waves + 1)
+
+            for future in done:
+                school_id = futures[future]
+                try:
+                    results[school_id] = future.result()
+                except TimeoutError:
+                    timed_out.append(school_id)
+                except Exception as e:
+                    errors[school_id] = str(e)
+            for future in not_done:
+                future.cancel()
+                timed_out.append(futures[future])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if errors or timed_out:
+            logger.warning(
+                f"Tenant fan-out over {len(tenants)} schools finished with "
+                f"{len(errors)} errors and {len(timed_out)} timeouts."
+            )
+        logger.debug(f"Tenant fan-out over {len(tenants)} schools took "
+                     f"{time.monotonic() - started:.2f}s")
+        return FanoutResult(results, errors, sorted(timed_out))
+
+    def _run_one(self, func, db_name):
+        """Run `func` for a single tenant on the current pool thread."""
+        alias = DbLoader().register_school_database(db_name)
+        connection = connections[alias]
+        try:
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute("SET statement_timeout = %s", [int(self.timeout * 1000)])
+            return func(alias)
+        except Exception as e:
+            if isinstance(e.__cause__, psycopg2.errors.QueryCanceled):
+                raise TimeoutError(f"Query on {db_name} exceeded {self.timeout}s") from e
+            raise
+        finally:
+            # Pool threads are short-lived; don't leave their connections behind
+            connection.close()
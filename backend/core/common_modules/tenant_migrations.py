@@ -0,0 +1,82 @@
+"""Tenant migrations module for applying migrations to school databases."""
+
+import logging
+import threading
+import time
+
+from django.core.management import call_command
+from django.db import connections
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+
+from core.common_modules.db_loader import DbLoader
+
+logger = logging.getLogger(__name__)
+
+TENANT_APPS = ('academics', 'classes', 'teacher', 'student', 'syllabus')
+
+# `migrate` is not thread-safe; provisioning threads and retry timers of a web
+# worker may run it concurrently
+_migrate_lock = threading.Lock()
+
+
+class TenantMigrator:
+    """Apply migrations to school databases, skipping the ones already up to date."""
+
+    @staticmethod
+    def get_leaf_nodes():
+        """Return the on-disk leaf migrations of the tenant apps."""
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        return sorted(node for node in loader.graph.leaf_nodes() if node[0] in TENANT_APPS)
+
+    @staticmethod
+    def is_up_to_date(db_key, leaf_nodes):
+        """Compare a tenant's django_migrations table against the leaf migrations."""
+        recorder = MigrationRecorder(connections[db_key])
+        if not recorder.has_table():
+            return False
+        applied = recorder.applied_migrations()
+        return all(tuple(node) in applied for node in leaf_nodes)
+
+    @staticmethod
+    def migrate(db_key):
+        """
+        Run every pending migration on a registered tenant alias in one pass.
+        Migrations of this process run one at a time; data migrations load
+        their fixtures through `schema_editor.connection.alias`.
+        """
+        with _migrate_lock:
+            call_command('migrate', database=db_key, interactive=False, verbosity=0)
+
+    @staticmethod
+    def migrate_school_db(db_name, leaf_nodes=None, force=False):
+        """
+        Migrate a single school database.
+        Args:
+            db_name (str): The school's database (or schema) name.
+            leaf_nodes (list): Leaf migrations used for the up-to-date pre-check.
+            force (bool): Migrate even when the database is already up to date.
+        Returns:
+            dict: The school's status ('skipped', 'migrated' or 'failed'), timing and error.
+        """
+        started = time.monotonic()
+        result = {'db_name': db_name, 'status': 'migrated', 'seconds': 0.0, 'error': None}
+        try:
+            db_key = DbLoader().register_school_database(db_name)
+            if leaf_nodes is None:
+                leaf_nodes = TenantMigrator.get_leaf_nodes()
+
+            if not force and TenantMigrator.is_up_to_date(db_key, leaf_nodes):
+                result['status'] = 'skipped'
+            else:
+                logger.info(f"Applying migrations for {db_name}...")
+                TenantMigrator.migrate(db_key)
+                logger.info(f"Migration successful for {db_name}")
+        except Exception as e:
+            logger.exception(f"Migration failed for {db_name}: {e}")
+            result['status'] = 'failed'
+            result['error'] = str(e)
+        finally:
+            connections.close_all()
+        result['seconds'] = time.monotonic() - started
+        return result
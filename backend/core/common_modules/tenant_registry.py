@@ -0,0 +1,163 @@
+"""Tenant registry module for resolving school databases without a query per request."""
+
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from school.models import SchoolDbMetadata
+
+logger = logging.getLogger(__name__)
+
+
+class TenantEntry(NamedTuple):
+    """Resolved tenant information for a single school."""
+    school_id: int
+    db_name: str
+    is_active: bool
+
+
+class TenantRegistry:
+    """
+    In-memory, per-worker map of school_id -> tenant database.
+
+    The registry is warmed once at boot and kept fresh through the
+    post_save/post_delete signals of SchoolDbMetadata and School. Every
+    invalidation also bumps a version stamp in the shared cache so that the
+    other workers drop their copy on their next lookup.
+    """
+
+    VERSION_CACHE_KEY = 'tenant_registry:version'
+
+    _entries = {}
+    # db_name -> school_id, so rows written through an alias resolve without a scan
+    _db_names = {}
+    _lock = threading.RLock()
+    _version = None
+    _last_version_check = 0.0
+
+    @classmethod
+    def warm(cls):
+        """Load every tenant in a single query."""
+        try:
+            rows = SchoolDbMetadata.objects.values_list(
+                'school_id', 'db_name', 'is_active', 'school__is_active'
+            )
+            entries = {
+                school_id: TenantEntry(school_id, db_name, bool(is_active and school_active))
+                for school_id, db_name, is_active, school_active in rows
+            }
+            with cls._lock:
+                cls._entries = entries
+                cls._db_names = {entry.db_name: entry.school_id for entry in entries.values()}
+                cls._version = cls._get_shared_version()
+                cls._last_version_check = time.monotonic()
+            logger.info("Tenant registry warmed with %s schools.", len(entries))
+        except Exception as e:
+            logger.error(f"Error warming tenant registry: {e}")
+
+    @classmethod
+    def get(cls, school_id) -> Optional[TenantEntry]:
+        """Return the tenant entry for a school, loading it on a miss."""
+        try:
+            school_id = int(school_id)
+        except (TypeError, ValueError):
+            return None
+
+        cls._sync_version()
+        entry = cls._entries.get(school_id)
+        if entry is not None:
+            return entry
+
+        row = SchoolDbMetadata.objects.filter(school_id=school_id).values_list(
+            'db_name', 'is_active', 'school__is_active'
+        ).first()
+        if row is None:
+            return None
+
+        db_name, is_active, school_active = row
+        entry = TenantEntry(school_id, db_name, bool(is_active and school_active))
+        with cls._lock:
+            cls._entries[school_id] = entry
+            cls._db_names[db_name] = school_id
+        return entry
+
+    @classmethod
+    def get_db_name(cls, school_id, active_only=True) -> Optional[str]:
+        """Return the database name of a school, or None if unknown/inactive."""
+        entry = cls.get(school_id)
+        if entry is None or (active_only and not entry.is_active):
+            return None
+        return entry.db_name
+
+    @classmethod
+    def get_by_db_name(cls, db_name) -> Optional[TenantEntry]:
+        """Return the tenant entry owning a database (or schema) name."""
+        cls._sync_version()
+        school_id = cls._db_names.get(db_name)
+        if school_id is None:
+            school_id = SchoolDbMetadata.objects.filter(db_name=db_name).values_list(
+                'school_id', flat=True
+            ).first()
+        return cls.get(school_id) if school_id is not None else None
+
+    @classmethod
+    def all(cls):
+        """Return every known tenant entry."""
+        cls._sync_version()
+        if not cls._entries:
+            cls.warm()
+        return list(cls._entries.values())
+
+    @classmethod
+    def invalidate(cls, school_id=None):
+        """Drop one school (or everything) locally and notify the other workers."""
+        with cls._lock:
+            if school_id is None:
+                cls._entries = {}
+                cls._db_names = {}
+            else:
+                entry = cls._entries.pop(int(school_id), None)
+                if entry is not None:
+                    cls._db_names.pop(entry.db_name, None)
+            cls._version = cls._bump_shared_version()
+            cls._last_version_check = time.monotonic()
+
+    @classmethod
+    def _sync_version(cls):
+        """Clear the local map when another worker has published a newer version."""
+        interval = settings.TENANT_DB_CONFIG['REGISTRY_VERSION_CHECK_INTERVAL']
+        now = time.monotonic()
+        if now - cls._last_version_check < interval:
+            return
+
+        shared_version = cls._get_shared_version()
+        with cls._lock:
+            cls._last_version_check = now
+            if shared_version != cls._version:
+                logger.info("Tenant registry version changed, reloading tenants.")
+                cls._entries = {}
+                cls._db_names = {}
+                cls._version = shared_version
+
+    @classmethod
+    def _get_shared_version(cls):
+        try:
+            return cache.get(cls.VERSION_CACHE_KEY)
+        except Exception as e:
+            logger.error(f"Error reading tenant registry version: {e}")
+            return cls._version
+
+    @classmethod
+    def _bump_shared_version(cls):
+        try:
+            return cache.incr(cls.VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(cls.VERSION_CACHE_KEY, 1, timeout=None)
+            return 1
+        except Exception as e:
+            logger.error(f"Error publishing tenant registry version: {e}")
+            return cls._version
@@ -0,0 +1,92 @@
+"""Tenant template module for provisioning school databases from a pre-migrated template."""
+
+import logging
+import time
+
+import psycopg2
+from django.conf import settings
+from django.db import connections
+
+from core.common_modules.db_loader import DbLoader
+from core.common_modules.tenant_migrations import TenantMigrator
+
+logger = logging.getLogger(__name__)
+
+# Serialises template refreshes and clones across workers
+TEMPLATE_LOCK_KEY = 'tenant_template_db'
+
+
+class TenantTemplate:
+    """
+    Maintain a fully migrated template database and clone new school databases from it.
+
+    Seed data loaded by the tenant migrations (e.g. SchoolClass rows) is baked
+    into the template, so a clone is ready to use without replaying any
+    migration. The template is migrated again whenever the on-disk tenant
+    migrations move ahead of it.
+    """
+
+    def __init__(self):
+        self.template_name = settings.TENANT_DB_CONFIG['TEMPLATE_DB_NAME']
+
+    def _admin_connection(self):
+        conn = psycopg2.connect(
+            dbname=settings.DB_CONFIG['NAME'],
+            user=settings.DB_CONFIG['USER'],
+            password=settings.DB_CONFIG['PASSWORD'],
+            host=settings.DB_CONFIG['HOST'],
+            port=settings.DB_CONFIG['PORT']
+        )
+        conn.autocommit = True
+        return conn
+
+    def refresh(self, cursor=None):
+        """Create the template if needed and migrate it when it is behind."""
+        if cursor is None:
+            conn = self._admin_connection()
+            try:
+                with conn.cursor() as admin_cursor:
+                    admin_cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", [TEMPLATE_LOCK_KEY])
+                    return self.refresh(admin_cursor)
+            finally:
+                conn.close()
+
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", [self.template_name])
+        if cursor.fetchone() is None:
+            logger.info(f"Creating tenant template database {self.template_name}")
+            cursor.execute(f'CREATE DATABASE "{self.template_name}"')
+
+        db_key = DbLoader().register_school_database(self.template_name)
+        try:
+            if TenantMigrator.is_up_to_date(db_key, TenantMigrator.get_leaf_nodes()):
+                return False
+            logger.info(f"Migrating tenant template database {self.template_name}")
+            TenantMigrator.migrate(db_key)
+            return True
+        finally:
+            # Postgres refuses to clone a template that has open sessions
+            connections[db_key].close()
+
+    def create_database(self, db_name, attempts=3):
+        """Create a school database as a copy of the (refreshed) template."""
+        conn = self._admin_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", [TEMPLATE_LOCK_KEY])
+                self.refresh(cursor)
+                for attempt in range(1, attempts + 1):
+                    try:
+                        cursor.execute(
+                            f'CREATE DATABASE "{db_name}" TEMPLATE "{self.template_name}"'
+                        )
+                        break
+                    except psycopg2.errors.ObjectInUse:
+                        if attempt == attempts:
+                            raise
+                        logger.warning(
+                            f"Template {self.template_name} is in use, retrying clone of {db_name}"
+                        )
+                        time.sleep(attempt)
+            logger.info(f"Cloned {db_name} from template {self.template_name}")
+        finally:
+            conn.close()
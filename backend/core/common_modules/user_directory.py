@@ -0,0 +1,63 @@
+"""User directory module for resolving core users referenced from school databases."""
+
+import logging
+import threading
+
+from core.models import User
+
+logger = logging.getLogger(__name__)
+
+# Thread-local storage for the request-scoped directory
+_directory_context = threading.local()
+
+
+class UserDirectory:
+    """
+    Batched, memoized lookup of `core.User` rows by id.
+
+    Tenant rows (Student.student_id, Teacher.teacher_id) only hold the id of
+    their user in the default DB. Collect the ids of a page of rows with
+    `prefetch`, which loads every missing user with a single `in_bulk` query;
+    later `get` calls for those ids are served from memory.
+
+    Within a request (see UserDirectoryMiddleware) `current()` returns the same
+    directory everywhere, so users are fetched at most once per request.
+    """
+
+    def __init__(self):
+        self._users = {}
+
+    @classmethod
+    def current(cls):
+        """Return the directory of the current request, or a throwaway one outside requests."""
+        directory = getattr(_directory_context, 'directory', None)
+        return directory if directory is not None else cls()
+
+    @classmethod
+    def activate(cls):
+        _directory_context.directory = cls()
+        return _directory_context.directory
+
+    @classmethod
+    def deactivate(cls):
+        _directory_context.directory = None
+
+    def prefetch(self, user_ids):
+        """Load every user of `user_ids` that isn't known yet in one query."""
+        missing = {user_id for user_id in user_ids
+                   if user_id is not None and user_id not in self._users}
+        if not missing:
+            return
+        users = User.objects.in_bulk(missing)
+        for user_id in missing:
+            self._users[user_id] = users.get(user_id)
+
+    def get(self, user_id):
+        """Return the user with `user_id`, or None if it doesn't exist."""
+        if user_id not in self._users:
+            self.prefetch([user_id])
+        return self._users.get(user_id)
+
+    def forget(self, user_id):
+        """Drop a memoized user, e.g. after updating it."""
+        self._users.pop(user_id, None)
@@ -0,0 +1,71 @@
+"""Chunking module for splitting textbooks into LLM-sized pieces."""
+
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# A line such as "Chapter 3", "CHAPTER 3: Motion", "Unit 2" or "Lesson 11"
+CHAPTER_HEADING = re.compile(r'^\s*(chapter|unit|lesson)\s+(\d+|[ivxlc]+)\b', re.IGNORECASE | re.MULTILINE)
+
+
+class TextbookChunker:
+    """
+    Split the pages of a textbook into chunks under a token budget.
+
+    Chapter boundaries are preferred: pages are first grouped by the chapter
+    heading they start with, then whole chapters are packed into chunks. A
+    chapter that alone exceeds the budget is cut into page windows.
+    """
+
+    # Rough tokens-per-character ratio of textbook English for Gemini/GPT tokenizers
+    CHARS_PER_TOKEN = 4
+
+    def __init__(self, token_budget):
+        self.token_budget = token_budget
+
+    @classmethod
+    def estimate_tokens(cls, text):
+        return len(text) // cls.CHARS_PER_TOKEN + 1
+
+    def split(self, pages):
+        """Return the list of chunk texts for the given page texts."""
+        chunks = []
+        current = []
+        current_tokens = 0
+        for segment in self._chapter_segments(pages):
+            for window in self._page_windows(segment):
+                tokens = sum(self.estimate_tokens(page) for page in window)
+                if current and current_tokens + tokens > self.token_budget:
+                    chunks.append(current)
+                    current, current_tokens = [], 0
+                current.extend(window)
+                current_tokens += tokens
+        if current:
+            chunks.append(current)
+
+        logger.info(f"Split {len(pages)} pages into {len(chunks)} chunks.")
+        return ["\n\n".join(chunk) for chunk in chunks]
+
+    @staticmethod
+    def _chapter_segments(pages):
+        """Group consecutive pages, starting a new group at each chapter heading."""
+        segments = []
+        for page in pages:
+            if not segments or CHAPTER_HEADING.search(page):
+                segments.append([])
+            segments[-1].append(page)
+        return segments
+
+    def _page_windows(self, segment):
+        """Cut a chapter into runs of pages that each fit the budget."""
+        windows = [[]]
+        tokens = 0
+        for page in segment:
+            page_tokens = self.estimate_tokens(page)
+            if windows[-1] and tokens + page_tokens > self.token_budget:
+                windows.append([])
+                tokens = 0
+            windows[-1].append(page)
+            tokens += page_tokens
+        return windows
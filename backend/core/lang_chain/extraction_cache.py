@@ -0,0 +1,121 @@
+"""Extraction cache module for reusing LLM results on identical textbook text."""
+
+import hashlib
+import logging
+import re
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import LlmExtractionCache
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """
+    Persistent cache of parsed extraction results.
+
+    Entries are keyed by the hash of the normalized input text, the prompt
+    version and the model name, so editing the prompt or switching models
+    never serves stale output. The table is bounded to MAX_ENTRIES rows: every
+    EVICT_EVERY stores, the least recently used entries beyond it are evicted.
+    """
+
+    # The table may overshoot MAX_ENTRIES by this many rows between evictions
+    EVICT_EVERY = 50
+
+    _lock = threading.Lock()
+    _counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    def __init__(self, prompt_template, model_name):
+        self.prompt_version = hashlib.sha256(prompt_template.encode()).hexdigest()[:16]
+        self.model_name = model_name
+
+    @staticmethod
+    def normalize(text):
+        """Collapse whitespace so re-extracted copies of the same PDF hash alike."""
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def text_hash(self, text):
+        return hashlib.sha256(self.normalize(text).encode()).hexdigest()
+
+    def key(self, text_hash):
+        return hashlib.sha256(
+            f"{text_hash}:{self.prompt_version}:{self.model_name}".encode()
+        ).hexdigest()
+
+    def get(self, text):
+        """Return the cached result for `text`, or None."""
+        cache_key = self.key(self.text_hash(text))
+        try:
+            entry = LlmExtractionCache.objects.filter(cache_key=cache_key).values('id', 'result').first()
+        except Exception as e:
+            logger.error(f"Error reading extraction cache: {e}")
+            entry = None
+        if entry is None:
+            self._count('misses')
+            return None
+
+        try:
+            LlmExtractionCache.objects.filter(id=entry['id']).update(
+                hit_count=F('hit_count') + 1, last_used_at=timezone.now())
+        except Exception as e:
+            # Usage stats are best effort; the hit is still served
+            logger.error(f"Error updating extraction cache usage: {e}")
+        self._count('hits')
+        return entry['result']
+
+    def set(self, text, result):
+        """Store a parsed result and evict the oldest entries beyond the size bound."""
+        text_hash = self.text_hash(text)
+        try:
+            LlmExtractionCache.objects.create(
+                cache_key=self.key(text_hash),
+                text_hash=text_hash,
+                prompt_version=self.prompt_version,
+                model_name=self.model_name,
+                result=result,
+            )
+            stores = self._count('stores')
+        except IntegrityError:
+            # Stored concurrently by another worker
+            return
+        except Exception as e:
+            logger.error(f"Error writing extraction cache: {e}")
+            return
+        if stores % self.EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self):
+        max_entries = settings.LLM_CONFIG['CACHE_MAX_ENTRIES']
+        try:
+            stale_ids = list(LlmExtractionCache.objects.order_by('-last_used_at').values_list(
+                'id', flat=True)[max_entries:])
+            if stale_ids:
+                LlmExtractionCache.objects.filter(id__in=stale_ids).delete()
+                self._count('evictions', len(stale_ids))
+        except Exception as e:
+            logger.error(f"Error evicting extraction cache entries: {e}")
+
+    @classmethod
+    def _count(cls, counter, value=1):
+        with cls._lock:
+            cls._counters[counter] += value
+            return cls._counters[counter]
+
+    @classmethod
+    def stats(cls):
+        """Return this worker's hit/miss counters and the size of the cache."""
+        with cls._lock:
+            counters = dict(cls._counters)
+        lookups = counters['hits'] + counters['misses']
+        return {
+            **counters,
+            'hit_rate': round(counters['hits'] / lookups, 3) if lookups else None,
+            'entries': LlmExtractionCache.objects.count(),
+            'max_entries': settings.LLM_CONFIG['CACHE_MAX_ENTRIES'],
+        }
@@ -1,17 +1,21 @@
 """Langchain module."""
 
+import asyncio
 import logging
+import time
 
 from django.conf import settings
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 
 from core.common_modules.common_functions import CommonFunctions
 
 
+from .chunking import TextbookChunker
+from .extraction_cache import ExtractionCache
+from .llm_gateway import LlmGateway
+from .text_normalizer import TextbookNormalizer
 from .states import ChapterInfo
 from .queries import LangchainQueries
 
@@ -20,21 +24,28 @@ logger = logging.getLogger(__name__)
 class LangChainService:
     """Service for Langchain operations."""
     def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.AI_MODELS.get('GEMINI_MODEL', 'gemini-2.5-flash'),
-            temperature=0,
-            api_key=settings.API_KEYS.get('GEMINI_API_KEY')
-        )
+        # The model client, rate limit and retries are shared by the whole process
+        self.gateway = LlmGateway.instance()
+        self.model_name = self.gateway.model_name
+        # NormalizationReport of the last textbook, see TextbookNormalizer
+        self.normalization_report = None
 
 
     def invoke_llm(self, pdf_text,prompt):
 
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        response = chain.run(input=pdf_text)
-
-        return response
+        return self.gateway.invoke(prompt.format(input=pdf_text))
 
     def get_topics_and_prerequisites(self,pdf_file):
+        """Extract the chapters of a PDF textbook (see get_topics_and_prerequisites_from_pages)."""
+        pages = CommonFunctions.extract_pages_from_pdf(pdf_file=pdf_file)
+        return self.get_topics_and_prerequisites_from_pages(pages)
+
+    def get_topics_and_prerequisites_from_pages(self, pages):
+        """
+        Extract the chapters of a textbook with their sub topics and prerequisites.
+        Large textbooks are split into chunks (see TextbookChunker) that are sent
+        to the model concurrently; the chapters found in every chunk are merged.
+        """
         chapter_parser = PydanticOutputParser(pydantic_object=ChapterInfo)
         prompt = PromptTemplate(
             template=LangchainQueries.EXTRACT_TOPICS_PREREQUISITES.value,
@@ -42,8 +53,78 @@ class LangChainService:
             partial_variables={"format_instructions": chapter_parser.get_format_instructions()}
         )
 
-        pdf_text = CommonFunctions.extract_text_from_pdf(pdf_file=pdf_file)
-        response = self.invoke_llm(pdf_text=pdf_text, prompt=prompt)
-        parsed = chapter_parser.parse(response)
-        
-        return parsed.model_dump()['result']
\ No newline at end of file
+        if settings.LLM_CONFIG['NORMALIZE_TEXT']:
+            # Running headers, page numbers and whitespace only cost tokens
+            pages, self.normalization_report = TextbookNormalizer().normalize(pages)
+        chunks = TextbookChunker(settings.LLM_CONFIG['CHUNK_TOKEN_BUDGET']).split(pages) or [""]
+
+        # Chunks already extracted with this prompt and model are served from the cache
+        cache = ExtractionCache(prompt.format(input=""), self.model_name) \
+            if settings.LLM_CONFIG['CACHE_ENABLED'] else None
+        results = [cache.get(chunk) if cache else None for chunk in chunks]
+        missing = [index for index, result in enumerate(results) if result is None]
+        logger.info(f"Extracting {len(missing)} of {len(chunks)} chunks "
+                    f"({len(chunks) - len(missing)} cached).")
+
+        if len(missing) == 1:
+            response = self.invoke_llm(pdf_text=chunks[missing[0]], prompt=prompt)
+            extracted = [chapter_parser.parse(response).model_dump()['result']]
+        elif missing:
+            extracted = asyncio.run(self.invoke_llm_on_chunks(
+                [chunks[index] for index in missing], prompt, chapter_parser))
+        else:
+            extracted = []
+        for index, result in zip(missing, extracted):
+            results[index] = result
+            if cache:
+                cache.set(chunks[index], result)
+
+        if len(results) == 1:
+            return results[0]
+        return self.merge_chapters(results)
+
+    async def invoke_llm_on_chunks(self, chunks, prompt, chapter_parser):
+        """Run the prompt on every chunk, at most CHUNK_CONCURRENCY at a time."""
+        semaphore = asyncio.Semaphore(settings.LLM_CONFIG['CHUNK_CONCURRENCY'])
+
+        async def run_chunk(index, chunk):
+            async with semaphore:
+                started = time.monotonic()
+                response = await self.gateway.ainvoke(prompt.format(input=chunk))
+                logger.info(f"Chunk {index + 1}/{len(chunks)} extracted in "
+                            f"{time.monotonic() - started:.1f}s")
+                return chapter_parser.parse(response).model_dump()['result']
+
+        return await asyncio.gather(*(run_chunk(index, chunk) for index, chunk in enumerate(chunks)))
+
+    @staticmethod
+    def merge_chapters(results):
+        """
+        Merge the chapters extracted from several chunks. A chapter split across
+        chunks is reported by each of them; its sub topics and prerequisites are
+        combined without duplicates.
+        """
+        chapters = {}
+        for chunk_chapters in results:
+            for chapter in chunk_chapters:
+                key = str(chapter['chapter_number']).strip().lower() or \
+                    chapter['chapter_name'].strip().lower()
+                merged = chapters.setdefault(key, {
+                    **chapter, 'sub_topics': [], 'pre_requisites': []
+                })
+                seen_sub_topics = {name.strip().lower() for name in merged['sub_topics']}
+                for sub_topic in chapter['sub_topics']:
+                    if sub_topic.strip().lower() not in seen_sub_topics:
+                        seen_sub_topics.add(sub_topic.strip().lower())
+                        merged['sub_topics'].append(sub_topic)
+                seen_topics = {item['topic'].strip().lower() for item in merged['pre_requisites']}
+                for prerequisite in chapter['pre_requisites']:
+                    if prerequisite['topic'].strip().lower() not in seen_topics:
+                        seen_topics.add(prerequisite['topic'].strip().lower())
+                        merged['pre_requisites'].append(prerequisite)
+
+        def chapter_order(chapter):
+            number = str(chapter['chapter_number']).strip()
+            return (0, int(number), '') if number.isdigit() else (1, 0, number)
+
+        return sorted(chapters.values(), key=chapter_order)
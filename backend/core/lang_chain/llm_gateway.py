@@ -0,0 +1,253 @@
+"""LLM gateway module: one rate-limited, pooled entry point to the language model."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+# HTTP statuses worth retrying: request timeout, rate limit and server errors
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# Transport and google-api-core errors raised without an HTTP status
+TRANSIENT_ERROR_NAMES = {
+    'Timeout', 'TimeoutException', 'ReadTimeout', 'ConnectTimeout', 'ConnectError',
+    'ConnectionError', 'RemoteDisconnected', 'ResourceExhausted', 'ServiceUnavailable',
+    'DeadlineExceeded', 'InternalServerError',
+}
+
+
+def is_transient(error):
+    """Whether a failed LLM call may succeed if sent again."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status_code = getattr(error, 'code', None) or getattr(error, 'status_code', None) or \
+        getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status_code, int):
+        return status_code in TRANSIENT_STATUS_CODES
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+class GeminiBackend:
+    """Google Gemini through langchain; the client is built once and reused."""
+
+    def __init__(self):
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        self.model_name = settings.AI_MODELS.get('GEMINI_MODEL', 'gemini-2.5-flash')
+        self.client = ChatGoogleGenerativeAI(
+            model=self.model_name,
+            temperature=0,
+            api_key=settings.API_KEYS.get('GEMINI_API_KEY')
+        )
+
+    def invoke(self, prompt_text):
+        """Return the response text and its token usage."""
+        message = self.client.invoke(prompt_text)
+        usage = getattr(message, 'usage_metadata', None) or {}
+        return message.content, {
+            'input_tokens': usage.get('input_tokens', 0),
+            'output_tokens': usage.get('output_tokens', 0),
+        }
+
+
+class StubBackend:
+    """
+    Offline backend replaying recorded responses, for load-testing the ingestion pipeline.
+
+    A response is looked up as `<sha256 of the prompt>.txt` in STUB_RESPONSES_DIR,
+    then `default.txt`; without either an empty extraction is returned.
+    Responses are recorded into that directory by running the real backend
+    with RECORD_RESPONSES set.
+    """
+
+    EMPTY_RESPONSE = '{"result": []}'
+
+    def __init__(self):
+        self.model_name = f"stub:{settings.AI_MODELS.get('GEMINI_MODEL', 'gemini-2.5-flash')}"
+        self.responses_dir = settings.LLM_CONFIG['STUB_RESPONSES_DIR']
+        self.latency = settings.LLM_CONFIG['STUB_LATENCY_SECONDS']
+
+    def invoke(self, prompt_text):
+        if self.latency:
+            time.sleep(self.latency)
+        response = self.EMPTY_RESPONSE
+        for file_name in (f"{LlmGateway.prompt_hash(prompt_text)}.txt", 'default.txt'):
+            path = os.path.join(self.responses_dir, file_name)
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as response_file:
+                    response = response_file.read()
+                break
+        return response, {
+            'input_tokens': len(prompt_text) // 4,
+            'output_tokens': len(response) // 4,
+        }
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` calls per `period` seconds, with bursts up to `rate`."""
+
+    def __init__(self, rate, period=60.0):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed; return the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.fill_rate
+            time.sleep(delay)
+            waited += delay
+
+
+class LlmGateway:
+    """
+    Process-wide gateway to the LLM.
+
+    Every model call of the process goes through one backend client, a token
+    bucket (LLM_CONFIG['RATE_LIMIT_PER_MINUTE']) and a concurrency cap
+    (LLM_CONFIG['MAX_CONCURRENCY']). Transient failures are retried with
+    exponential backoff and full jitter. Latency, retries and token usage are
+    recorded for `stats()`.
+
+    Usage:
+        text = LlmGateway.instance().invoke(prompt_text)
+    """
+
+    BACKENDS = {
+        'gemini': GeminiBackend,
+        'stub': StubBackend,
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        config = settings.LLM_CONFIG
+        self.backend = self.BACKENDS[config['BACKEND']]()
+        self.model_name = self.backend.model_name
+        self.bucket = TokenBucket(config['RATE_LIMIT_PER_MINUTE'])
+        self.slots = threading.BoundedSemaphore(config['MAX_CONCURRENCY'])
+        self.max_retries = config['MAX_RETRIES']
+        self.backoff_base = config['RETRY_BACKOFF_SECONDS']
+        self.record_dir = config['RECORD_RESPONSES'] and config['STUB_RESPONSES_DIR']
+
+        self._metrics_lock = threading.Lock()
+        self._latencies = deque(maxlen=1000)
+        self._counters = {
+            'calls': 0, 'failures': 0, 'retries': 0, 'in_flight': 0,
+            'rate_limited_seconds': 0.0, 'input_tokens': 0, 'output_tokens': 0,
+        }
+
+    @classmethod
+    def instance(cls):
+        """Return the gateway of this process, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    logger.info(f"LLM gateway started with backend {settings.LLM_CONFIG['BACKEND']}.")
+        return cls._instance
+
+    @staticmethod
+    def prompt_hash(prompt_text):
+        return hashlib.sha256(prompt_text.encode()).hexdigest()
+
+    def invoke(self, prompt_text):
+        """
+        Send a prompt to the model and return the response text.
+        Only transient errors (rate limits, server errors, timeouts, dropped
+        connections) are retried; anything else, such as a bad request or an
+        invalid API key, is raised at once.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._call(prompt_text)
+            except Exception as e:
+                if attempt == self.max_retries or not is_transient(e):
+                    self._count('failures')
+                    logger.error(f"LLM call failed after {attempt + 1} attempts: {e}")
+                    raise
+                delay = random.uniform(0, self.backoff_base * (2 ** attempt))
+                self._count('retries')
+                logger.warning(f"LLM call failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def ainvoke(self, prompt_text):
+        """Async variant of `invoke`; the call runs on a worker thread under the same limits."""
+        return await asyncio.to_thread(self.invoke, prompt_text)
+
+    def _call(self, prompt_text):
+        waited = self.bucket.acquire()
+        with self.slots:
+            self._count('in_flight')
+            started = time.monotonic()
+            try:
+                response, usage = self.backend.invoke(prompt_text)
+            finally:
+                self._count('in_flight', -1)
+        latency = time.monotonic() - started
+
+        with self._metrics_lock:
+            self._latencies.append(latency)
+            self._counters['calls'] += 1
+            self._counters['rate_limited_seconds'] += waited
+            self._counters['input_tokens'] += usage['input_tokens']
+            self._counters['output_tokens'] += usage['output_tokens']
+        logger.info(f"LLM call took {latency:.2f}s ({usage['input_tokens']} input, "
+                    f"{usage['output_tokens']} output tokens)")
+
+        if self.record_dir and not isinstance(self.backend, StubBackend):
+            self._record(prompt_text, response)
+        return response
+
+    def _record(self, prompt_text, response):
+        try:
+            os.makedirs(self.record_dir, exist_ok=True)
+            path = os.path.join(self.record_dir, f"{self.prompt_hash(prompt_text)}.txt")
+            with open(path, 'w', encoding='utf-8') as response_file:
+                response_file.write(response)
+        except OSError as e:
+            logger.error(f"Error recording LLM response: {e}")
+
+    def _count(self, counter, value=1):
+        with self._metrics_lock:
+            self._counters[counter] += value
+
+    def stats(self):
+        """Return call counts, latency percentiles and token usage of this process."""
+        with self._metrics_lock:
+            latencies = sorted(self._latencies)
+            counters = dict(self._counters)
+
+        def percentile(fraction):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))], 3)
+
+        return {
+            'backend': settings.LLM_CONFIG['BACKEND'],
+            'model': self.model_name,
+            **counters,
+            'rate_limited_seconds': round(counters['rate_limited_seconds'], 3),
+            'latency_p50': percentile(0.5),
+            'latency_p95': percentile(0.95),
+            'latency_max': round(latencies[-1], 3) if latencies else None,
+        }
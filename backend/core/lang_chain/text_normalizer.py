@@ -0,0 +1,117 @@
+"""Text normalization module for trimming textbook text before it is sent to the LLM."""
+
+import logging
+import re
+from collections import Counter
+from typing import NamedTuple
+
+from .chunking import CHAPTER_HEADING, TextbookChunker
+
+logger = logging.getLogger(__name__)
+
+# "12", "- 12 -", "Page 12", "12 of 240", "xiv"; roman numerals only in
+# lowercase and well formed, so lines such as "Civil" or "Ill" are kept
+PAGE_NUMBER = re.compile(
+    r'^[\s\-–—]*((?i:page)\s*)?'
+    r'(\d+|(?=[mdclxvi])m{0,3}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3}))'
+    r'(\s*((?i:of)|/)\s*\d+)?[\s\-–—]*$'
+)
+# A word broken over two lines: "magne-\ntism"
+HYPHENATED_BREAK = re.compile(r'(\w+)-\n\s*([a-z]\w*)')
+# A hyphenated compound within a line: "well-known"
+COMPOUND = re.compile(r'\b(\w+)-(\w+)\b')
+SPACES = re.compile(r'[ \t\f\v ]+')
+
+
+class NormalizationReport(NamedTuple):
+    """Estimated tokens of the text before and after normalization."""
+    tokens_before: int
+    tokens_after: int
+    repeated_lines_removed: int
+
+    @property
+    def tokens_saved(self):
+        return self.tokens_before - self.tokens_after
+
+    @property
+    def saved_ratio(self):
+        return self.tokens_saved / self.tokens_before if self.tokens_before else 0.0
+
+
+class TextbookNormalizer:
+    """
+    Remove the noise PDF extraction leaves in textbook pages.
+
+    Running headers and footers are lines near the top or bottom of a page
+    that repeat on at least REPEAT_RATIO of the pages (digits ignored, so
+    "Physics 12" and "Physics 13" are the same line); they are dropped along
+    with bare page numbers. A word hyphenated across lines is joined, unless
+    the book also hyphenates it within a line ("well-\nknown" stays
+    "well-known"); whitespace is collapsed. Chapter headings are always kept
+    because the chunker and the prompt rely on them.
+    """
+
+    # Lines at each end of a page searched for headers and footers
+    EDGE_LINES = 3
+    REPEAT_RATIO = 0.4
+    MIN_PAGES = 4
+
+    def normalize(self, pages):
+        """Return the normalized pages and a NormalizationReport."""
+        tokens_before = sum(TextbookChunker.estimate_tokens(page) for page in pages)
+        compounds = self._compounds(pages)
+        split_pages = [self._lines(page, compounds) for page in pages]
+        repeated = self._repeated_lines(split_pages)
+
+        removed = 0
+        normalized = []
+        for lines in split_pages:
+            kept = []
+            for index, line in enumerate(lines):
+                at_edge = index < self.EDGE_LINES or index >= len(lines) - self.EDGE_LINES
+                if at_edge and not CHAPTER_HEADING.match(line) and (
+                        PAGE_NUMBER.match(line) or self._signature(line) in repeated):
+                    removed += 1
+                    continue
+                kept.append(line)
+            normalized.append("\n".join(kept))
+
+        report = NormalizationReport(
+            tokens_before=tokens_before,
+            tokens_after=sum(TextbookChunker.estimate_tokens(page) for page in normalized),
+            repeated_lines_removed=removed,
+        )
+        logger.info(f"Normalized {len(pages)} pages: {report.tokens_before} -> {report.tokens_after} "
+                    f"tokens ({report.saved_ratio:.0%} saved, {removed} header/footer lines removed).")
+        return normalized, report
+
+    @staticmethod
+    def _compounds(pages):
+        """Lowercased hyphenated words written within a line anywhere in the book."""
+        return {match.group(0).lower() for page in pages for match in COMPOUND.finditer(page)}
+
+    @staticmethod
+    def _lines(page, compounds):
+        def join(match):
+            head, tail = match.groups()
+            separator = '-' if f"{head}-{tail}".lower() in compounds else ''
+            return f"{head}{separator}{tail}"
+
+        page = HYPHENATED_BREAK.sub(join, page)
+        return [SPACES.sub(" ", line).strip() for line in page.splitlines()
+                if line.strip()]
+
+    @staticmethod
+    def _signature(line):
+        return re.sub(r'\d+', '#', line.lower())
+
+    def _repeated_lines(self, split_pages):
+        """Signatures of the lines repeating at the edges of enough pages to be headers or footers."""
+        if len(split_pages) < self.MIN_PAGES:
+            return set()
+        counts = Counter()
+        for lines in split_pages:
+            edges = lines[:self.EDGE_LINES] + lines[-self.EDGE_LINES:]
+            counts.update({self._signature(line) for line in edges})
+        threshold = max(2, int(len(split_pages) * self.REPEAT_RATIO))
+        return {signature for signature, count in counts.items() if count >= threshold}
@@ -0,0 +1,56 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.common_modules.pdf_text_extractor import PARSERS, PdfTextExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Measure PDF text extraction speed (pages/second) of each parser on sample PDFs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Sample PDF files.')
+        parser.add_argument('--parser', action='append', dest='parsers', choices=list(PARSERS),
+                            help='Parser to benchmark (can be repeated; default: all installed).')
+        parser.add_argument('--workers', type=int, action='append', dest='workers',
+                            help='Process count to benchmark (can be repeated; default: 1 and the configured count).')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs per combination; the best run is reported.')
+
+    def handle(self, *args, **kwargs):
+        parsers = kwargs['parsers'] or list(PARSERS)
+        worker_counts = kwargs['workers'] or sorted({1, PdfTextExtractor().workers})
+
+        for parser_name in parsers:
+            for workers in worker_counts:
+                extractor = PdfTextExtractor(parser=parser_name, workers=workers)
+                if workers > 1:
+                    # Measure parsing, not the start-up of the pool
+                    PdfTextExtractor.shutdown_pool()
+                    extractor.get_pool(workers)
+                try:
+                    self.benchmark(extractor, kwargs['paths'], kwargs['repeat'])
+                except ImportError as e:
+                    self.stdout.write(self.style.WARNING(f"{parser_name}: not installed ({e})"))
+                    break
+                except OSError as e:
+                    raise CommandError(str(e))
+        PdfTextExtractor.shutdown_pool()
+
+    def benchmark(self, extractor, paths, repeat):
+        for path in paths:
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                pages = extractor.extract_pages(path)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            characters = sum(len(page) for page in pages)
+            self.stdout.write(
+                f"{extractor.parser_name:<8} workers={extractor.workers:<3} {path}: "
+                f"{len(pages)} pages, {characters} chars, {best:.2f}s, "
+                f"{len(pages) / best if best else 0:.1f} pages/s"
+            )
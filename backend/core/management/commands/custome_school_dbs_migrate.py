@@ -1,12 +1,13 @@
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+import django
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
-from django.conf import settings
-from django.test.utils import override_settings
+from django.db import connections
 
 from school.models import SchoolDbMetadata
-from core.common_modules.db_loader import DbLoader
+from core.common_modules.tenant_migrations import TenantMigrator
 
 logger = logging.getLogger(__name__)
 
@@ -14,35 +15,61 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Apply migrations to all dynamically registered school databases'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=1,
+                            help='Number of school databases to migrate concurrently.')
+        parser.add_argument('--force', action='store_true',
+                            help='Migrate school databases even if they are already up to date.')
+
     def handle(self, *args, **kwargs):
         logger.info("Starting migration for all school databases...")
+        jobs = max(1, kwargs['jobs'])
+        force = kwargs['force']
 
         try:
-            all_metadata = SchoolDbMetadata.objects.all()
-            db_loader = DbLoader()
-            for school_db in all_metadata:
-                db_key = school_db.db_name
-
-                if db_key not in settings.DATABASES:
-                    db_loader.load_dynamic_databases(
-                        db_key = db_key,
-                        engine = settings.DB_CONFIG['ENGINE'],
-                        name = school_db.db_name,
-                        user = settings.DB_CONFIG['USER'],
-                        password = settings.DB_CONFIG['PASSWORD'],
-                        host = settings.DB_CONFIG['HOST'],
-                        port = settings.DB_CONFIG['PORT']
-                    )
-
-                logger.info(f"Applying migrations for {db_key}...")
-                try:
-                    apps = ['academics','classes','teacher','student','syllabus']
-                    with override_settings(CURRENT_MIGRATION_DB=db_key):
-                        for app in apps:
-                            call_command("migrate",app, database=db_key,verbosity=2)
-                            logger.info(f"Migration successful for {db_key}")
-                except Exception as migrate_error:
-                    logger.exception(f"Migration failed for {db_key}: {migrate_error}")
-
+            db_names = list(SchoolDbMetadata.objects.values_list('db_name', flat=True))
+            leaf_nodes = TenantMigrator.get_leaf_nodes()
         except Exception as e:
             logger.exception(f"Error while loading school databases: {e}")
+            return
+
+        results = []
+        if jobs == 1 or len(db_names) <= 1:
+            for db_name in db_names:
+                results.append(TenantMigrator.migrate_school_db(db_name, leaf_nodes, force))
+        else:
+            # Workers open their own connections; never share ours across processes
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=django.setup) as executor:
+                futures = {
+                    executor.submit(TenantMigrator.migrate_school_db, db_name, leaf_nodes, force):
+                    db_name for db_name in db_names
+                }
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append({'db_name': futures[future], 'status': 'failed',
+                                        'seconds': 0.0, 'error': str(e)})
+
+        self.print_summary(results)
+
+    def print_summary(self, results):
+        """Print per-school timings and failures."""
+        self.stdout.write("")
+        self.stdout.write(f"{'School database':<50} {'Status':<10} {'Time':>9}")
+        for result in sorted(results, key=lambda item: item['db_name']):
+            line = f"{result['db_name']:<50} {result['status']:<10} {result['seconds']:>8.2f}s"
+            if result['status'] == 'failed':
+                self.stdout.write(self.style.ERROR(f"{line}  {result['error']}"))
+            else:
+                self.stdout.write(line)
+
+        counts = {status: sum(1 for result in results if result['status'] == status)
+                  for status in ('migrated', 'skipped', 'failed')}
+        self.stdout.write(
+            f"\n{len(results)} school databases: {counts['migrated']} migrated, "
+            f"{counts['skipped']} skipped, {counts['failed']} failed."
+        )
@@ -0,0 +1,40 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from core.common_modules.tenant_registry import TenantRegistry
+from school.models import SchoolStats
+from school.services.school_stats_service import SchoolStatsService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Recompute the SchoolStats counters from every school database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--school-id', type=int, action='append', dest='school_ids',
+                            help='Only reconcile this school (can be repeated).')
+        parser.add_argument('--missing', action='store_true',
+                            help='Only reconcile schools whose counters were never computed.')
+
+    def handle(self, *args, **kwargs):
+        tenants = [tenant for tenant in TenantRegistry.all() if tenant.is_active]
+        if kwargs['school_ids']:
+            tenants = [tenant for tenant in tenants if tenant.school_id in kwargs['school_ids']]
+        if kwargs['missing']:
+            reconciled = set(SchoolStats.objects.filter(reconciled_at__isnull=False)
+                             .values_list('school_id', flat=True))
+            tenants = [tenant for tenant in tenants if tenant.school_id not in reconciled]
+
+        logger.info(f"Reconciling stats for {len(tenants)} schools...")
+        outcome = SchoolStatsService().reconcile(tenants)
+
+        for school_id, error in sorted(outcome.errors.items()):
+            self.stdout.write(self.style.ERROR(f"School {school_id}: {error}"))
+        for school_id in outcome.timed_out:
+            self.stdout.write(self.style.ERROR(f"School {school_id}: timed out"))
+        self.stdout.write(
+            f"{len(outcome.results)} schools reconciled, "
+            f"{len(outcome.errors) + len(outcome.timed_out)} failed."
+        )
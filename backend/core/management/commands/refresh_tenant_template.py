@@ -0,0 +1,24 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from core.common_modules.tenant_template import TenantTemplate
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Create or migrate the template database new school databases are cloned from'
+
+    def handle(self, *args, **kwargs):
+        template = TenantTemplate()
+        try:
+            migrated = template.refresh()
+        except Exception as e:
+            logger.exception(f"Error while refreshing tenant template {template.template_name}: {e}")
+            return
+
+        if migrated:
+            self.stdout.write(f"Tenant template {template.template_name} migrated.")
+        else:
+            self.stdout.write(f"Tenant template {template.template_name} is up to date.")
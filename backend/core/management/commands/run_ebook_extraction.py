@@ -0,0 +1,39 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from syllabus.services.ebook_extraction_service import EbookExtractionService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Run the background worker that extracts the syllabus of uploaded eBooks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Process the pending eBooks and exit instead of polling.')
+
+    def handle(self, *args, **kwargs):
+        service = EbookExtractionService()
+        poll_interval = settings.EXTRACTION_CONFIG['POLL_INTERVAL']
+        logger.info("eBook extraction worker started.")
+
+        while True:
+            try:
+                ebook = service.claim()
+                if ebook:
+                    service.run(ebook)
+                    self.stdout.write(f"eBook {ebook.id}: {ebook.extraction_status}")
+                    continue
+            except Exception as e:
+                logger.exception(f"Error in eBook extraction worker: {e}")
+            finally:
+                connections.close_all()
+
+            if kwargs['once']:
+                break
+            time.sleep(poll_interval)
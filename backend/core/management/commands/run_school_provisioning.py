@@ -0,0 +1,39 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from school.services.provisioning_service import SchoolProvisioningService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Run the background worker that provisions new school databases'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Process the pending jobs and exit instead of polling.')
+
+    def handle(self, *args, **kwargs):
+        service = SchoolProvisioningService()
+        poll_interval = settings.PROVISIONING_CONFIG['POLL_INTERVAL']
+        logger.info("School provisioning worker started.")
+
+        while True:
+            try:
+                job = service.claim_job()
+                if job:
+                    service.run_job(job)
+                    self.stdout.write(f"Provisioning job {job.id} for school {job.school_id}: {job.status}")
+                    continue
+            except Exception as e:
+                logger.exception(f"Error in school provisioning worker: {e}")
+            finally:
+                connections.close_all()
+
+            if kwargs['once']:
+                break
+            time.sleep(poll_interval)
@@ -1,6 +1,5 @@
 # core/middleware.py
 import threading
-import logging
 
 from django.conf import settings
 from django.http import JsonResponse
@@ -9,11 +8,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 
 from school.models import School
-
-from core.common_modules.db_loader import DbLoader
-
-# Flag to ensure dynamic DBs are loaded once
-_db_initialized = threading.Event()
+from core.common_modules.user_directory import UserDirectory
 
 # Thread-local storage for request-scoped DB name
 _db_context = threading.local()
@@ -24,27 +19,6 @@ def set_current_db(db_name):
 def get_current_db():
     return getattr(_db_context, 'db', None)
 
-class LoadDynamicDatabasesMiddleware:
-    """
-    Middleware to load all dynamic databases once at server startup.
-    Should be placed high in the middleware order.
-    """
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        if not _db_initialized.is_set():
-            try:
-                DbLoader().load_databases()
-                _db_initialized.set()
-            except Exception as e:
-                logging.error(f"[DB INIT ERROR] Failed to load dynamic DBs: {e}")
-                return JsonResponse({"error": "Internal server error during DB setup."}, status=500)
-
-        return self.get_response(request)
-
-                
-
 class AuthenticationMiddleware:
     """
     Middleware to set current DB context based on authenticated user's school.
@@ -108,3 +82,19 @@ class AuthenticationMiddleware:
         response = self.get_response(request)
         # set_current_db(None)
         return response
+
+
+class UserDirectoryMiddleware:
+    """
+    Middleware that gives every request its own UserDirectory, so users
+    referenced by school DB rows are fetched once per request.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        UserDirectory.activate()
+        try:
+            return self.get_response(request)
+        finally:
+            UserDirectory.deactivate()
@@ -77,6 +77,24 @@ class Role(models.Model):
         return self.name
 
 
+class LlmExtractionCache(models.Model):
+    """Parsed LLM extraction output, keyed by input text, prompt version and model."""
+    cache_key = models.CharField(max_length=64, unique=True)
+    text_hash = models.CharField(max_length=64)
+    prompt_version = models.CharField(max_length=64)
+    model_name = models.CharField(max_length=100)
+    result = models.JSONField()
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = 'llm_extraction_cache'
+
+    def __str__(self):
+        return f"{self.model_name} - {self.text_hash[:12]}"
+
+
 
 
 ###### Abstract models for Chapter, SubTopic, and Prerequisite
@@ -1,3 +1,253 @@
-from django.test import TestCase
+import time
 
-# Create your tests here.
+from django.conf import settings
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from core.models import User
+from core.common_modules.pagination import KeysetPaginator, InvalidCursor
+from core.lang_chain.chunking import TextbookChunker
+from core.lang_chain.lang_chain import LangChainService
+from core.lang_chain.llm_gateway import LlmGateway, TokenBucket, is_transient
+from core.lang_chain.text_normalizer import TextbookNormalizer
+
+
+class KeysetPaginatorCursorTest(SimpleTestCase):
+
+    def test_cursor_round_trip(self):
+        paginator = KeysetPaginator(ordering=('name', 'id'))
+        cursor = paginator.encode({'name': 'Physics', 'id': 7})
+        self.assertEqual(paginator.decode(cursor), ['Physics', 7])
+
+    def test_garbage_cursor_is_rejected(self):
+        with self.assertRaises(InvalidCursor):
+            KeysetPaginator().decode('not a cursor!')
+
+    def test_cursor_of_another_ordering_is_rejected(self):
+        cursor = KeysetPaginator(ordering=('name', 'id')).encode({'name': 'Physics', 'id': 7})
+        with self.assertRaises(InvalidCursor):
+            KeysetPaginator(ordering=('id',)).decode(cursor)
+
+    def test_request_without_cursor_or_page_size_is_unbounded(self):
+        request = RequestFactory().get('/students', {'school_id': 1})
+        self.assertTrue(KeysetPaginator.from_request(request).unbounded)
+
+    def test_request_with_page_size_or_cursor_is_paged(self):
+        factory = RequestFactory()
+        paginator = KeysetPaginator.from_request(factory.get('/students', {'page_size': 5}))
+        self.assertFalse(paginator.unbounded)
+        self.assertEqual(paginator.page_size, 5)
+        cursor = KeysetPaginator().encode({'id': 3})
+        self.assertFalse(KeysetPaginator.from_request(factory.get('/students', {'cursor': cursor})).unbounded)
+
+    def test_page_size_is_capped(self):
+        paginator = KeysetPaginator(page_size=10 ** 6)
+        self.assertLessEqual(paginator.page_size, 500)
+
+    def test_non_numeric_page_size_is_rejected(self):
+        request = RequestFactory().get('/students', {'page_size': 'all'})
+        with self.assertRaises(InvalidCursor):
+            KeysetPaginator.from_request(request)
+
+
+class KeysetPaginatorQueryTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(7):
+            User.objects.create(user_name=f'user{index}', email=f'user{index}@example.com',
+                                first_name='Same' if index % 2 else 'Other')
+
+    def collect(self, ordering, page_size):
+        rows, cursor = KeysetPaginator(ordering=ordering, page_size=page_size).paginate(
+            User.objects.all())
+        collected = list(rows)
+        while cursor:
+            rows, cursor = KeysetPaginator(ordering=ordering, page_size=page_size,
+                                           cursor=cursor).paginate(User.objects.all())
+            collected.extend(rows)
+        return [user.id for user in collected]
+
+    def test_pages_cover_every_row_once(self):
+        expected = list(User.objects.order_by('id').values_list('id', flat=True))
+        self.assertEqual(self.collect(('id',), 2), expected)
+
+    def test_pages_follow_a_compound_descending_ordering(self):
+        expected = list(User.objects.order_by('-first_name', 'id').values_list('id', flat=True))
+        self.assertEqual(self.collect(('-first_name', 'id'), 3), expected)
+
+    def test_unbounded_paginator_returns_everything(self):
+        rows, cursor = KeysetPaginator(unbounded=True).paginate(User.objects.all())
+        self.assertEqual(len(rows), 7)
+        self.assertIsNone(cursor)
+
+
+class TokenBucketTest(SimpleTestCase):
+
+    def test_burst_up_to_capacity_then_waits_for_refill(self):
+        # 5 calls per half second: a burst of 5, then one call every 0.1s
+        bucket = TokenBucket(rate=5, period=0.5)
+        self.assertEqual([bucket.acquire() for _ in range(5)], [0.0] * 5)
+
+        started = time.monotonic()
+        waited = bucket.acquire()
+        self.assertGreater(waited, 0)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+
+class ApiError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class ServiceUnavailable(Exception):
+    pass
+
+
+class FlakyBackend:
+    model_name = 'flaky'
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def invoke(self, prompt_text):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return '{"result": []}', {'input_tokens': 1, 'output_tokens': 1}
+
+
+@override_settings(LLM_CONFIG={**settings.LLM_CONFIG, 'BACKEND': 'stub', 'MAX_RETRIES': 3,
+                               'RETRY_BACKOFF_SECONDS': 0, 'RECORD_RESPONSES': False})
+class LlmGatewayRetryTest(SimpleTestCase):
+
+    def gateway(self, errors):
+        gateway = LlmGateway()
+        gateway.backend = FlakyBackend(errors)
+        return gateway
+
+    def test_transient_errors_are_retried(self):
+        gateway = self.gateway([ApiError(429), TimeoutError(), ServiceUnavailable()])
+        self.assertEqual(gateway.invoke('prompt'), '{"result": []}')
+        self.assertEqual(gateway.backend.calls, 4)
+        self.assertEqual(gateway.stats()['retries'], 3)
+
+    def test_permanent_errors_are_raised_at_once(self):
+        for error in (ApiError(400), ApiError(403), ValueError('bad prompt')):
+            gateway = self.gateway([error])
+            with self.assertRaises(type(error)):
+                gateway.invoke('prompt')
+            self.assertEqual(gateway.backend.calls, 1)
+
+    def test_transient_errors_give_up_after_max_retries(self):
+        gateway = self.gateway([ApiError(503)] * 10)
+        with self.assertRaises(ApiError):
+            gateway.invoke('prompt')
+        self.assertEqual(gateway.backend.calls, 4)
+
+    def test_classification(self):
+        self.assertTrue(is_transient(ConnectionResetError()))
+        self.assertTrue(is_transient(ApiError(500)))
+        self.assertFalse(is_transient(ApiError(401)))
+        self.assertFalse(is_transient(KeyError('result')))
+
+
+class TextbookChunkerTest(SimpleTestCase):
+
+    @staticmethod
+    def page(label, tokens):
+        # estimate_tokens counts 4 characters per token
+        return label + "x" * (tokens * TextbookChunker.CHARS_PER_TOKEN - len(label))
+
+    def test_every_page_is_kept_in_order(self):
+        pages = [self.page(f"Chapter {n}\n" if n % 3 == 0 else f"p{n}", 30) for n in range(10)]
+        chunks = TextbookChunker(token_budget=100).split(pages)
+        self.assertEqual("\n\n".join(chunks), "\n\n".join(pages))
+
+    def test_chunks_stay_under_budget(self):
+        pages = [self.page(f"p{n}", 30) for n in range(10)]
+        for chunk in TextbookChunker(token_budget=100).split(pages):
+            self.assertLessEqual(TextbookChunker.estimate_tokens(chunk), 100 + 3)
+
+    def test_chapters_are_not_split_when_they_fit(self):
+        chapter_1 = [self.page("Chapter 1\n", 30), self.page("a", 30)]
+        chapter_2 = [self.page("Chapter 2\n", 30), self.page("b", 30)]
+        chunks = TextbookChunker(token_budget=100).split(chapter_1 + chapter_2)
+        self.assertEqual(chunks, ["\n\n".join(chapter_1), "\n\n".join(chapter_2)])
+
+    def test_oversized_chapter_is_cut_into_page_windows(self):
+        chapter = [self.page("Chapter 1\n", 40)] + [self.page(f"p{n}", 40) for n in range(4)]
+        chunks = TextbookChunker(token_budget=100).split(chapter)
+        self.assertEqual(chunks, ["\n\n".join(chapter[0:2]), "\n\n".join(chapter[2:4]), chapter[4]])
+
+
+class MergeChaptersTest(SimpleTestCase):
+
+    @staticmethod
+    def chapter(number, name, sub_topics, prerequisites=()):
+        return {
+            'chapter_number': number,
+            'chapter_name': name,
+            'sub_topics': list(sub_topics),
+            'pre_requisites': [{'topic': topic, 'explanation': ''} for topic in prerequisites],
+        }
+
+    def test_chapter_split_across_chunks_is_merged_without_duplicates(self):
+        merged = LangChainService.merge_chapters([
+            [self.chapter(1, 'Motion', ['Speed', 'Velocity'], ['Units'])],
+            [self.chapter(1, 'Motion', ['velocity ', 'Acceleration'], ['units', 'Graphs'])],
+        ])
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0]['sub_topics'], ['Speed', 'Velocity', 'Acceleration'])
+        self.assertEqual([item['topic'] for item in merged[0]['pre_requisites']], ['Units', 'Graphs'])
+
+    def test_chapters_are_ordered_by_number(self):
+        merged = LangChainService.merge_chapters([
+            [self.chapter(10, 'Light', []), self.chapter(2, 'Force', [])],
+            [self.chapter('A', 'Appendix', []), self.chapter(1, 'Motion', [])],
+        ])
+        self.assertEqual([chapter['chapter_name'] for chapter in merged],
+                         ['Motion', 'Force', 'Light', 'Appendix'])
+
+
+class TextbookNormalizerTest(SimpleTestCase):
+
+    def book(self, bodies):
+        return [f"Physics Class 9 - NCERT {number + 3}\n{body}\n{number + 3}"
+                for number, body in enumerate(bodies)]
+
+    def test_running_headers_and_page_numbers_are_removed(self):
+        pages, report = TextbookNormalizer().normalize(self.book(
+            ["Chapter 1 Motion\nA body at rest.", "Speed is distance over time.",
+             "Velocity has a direction.", "Acceleration changes velocity."]))
+        self.assertEqual(pages, ["Chapter 1 Motion\nA body at rest.", "Speed is distance over time.",
+                                 "Velocity has a direction.", "Acceleration changes velocity."])
+        self.assertEqual(report.repeated_lines_removed, 8)
+        self.assertGreater(report.tokens_saved, 0)
+
+    def test_words_made_of_roman_numeral_letters_are_kept(self):
+        pages, report = TextbookNormalizer().normalize(
+            ["Civil\nRights of citizens.\nIll", "Vii\nxiv", "LXI\nMix\niv"])
+        self.assertEqual(pages, ["Civil\nRights of citizens.\nIll", "Vii", "LXI\nMix"])
+        self.assertEqual(report.repeated_lines_removed, 2)
+
+    def test_short_documents_keep_repeated_lines(self):
+        pages, _ = TextbookNormalizer().normalize(self.book(["One.", "Two."]))
+        self.assertEqual(pages, ["Physics Class 9 - NCERT 3\nOne.", "Physics Class 9 - NCERT 4\nTwo."])
+
+    def test_repeated_chapter_headings_are_kept(self):
+        pages, _ = TextbookNormalizer().normalize(
+            [f"Chapter 2 Force\nPage body {number}." for number in range(5)])
+        self.assertTrue(all(page.startswith("Chapter 2 Force") for page in pages))
+
+    def test_words_broken_over_lines_are_joined(self):
+        pages, _ = TextbookNormalizer().normalize(["The force of magne-\n  tism attracts iron."])
+        self.assertEqual(pages, ["The force of magnetism attracts iron."])
+
+    def test_hyphenated_compounds_keep_their_hyphen(self):
+        pages, _ = TextbookNormalizer().normalize([
+            "Newton's laws are well-\nknown.",
+            "A well-known result is inertia.",
+        ])
+        self.assertEqual(pages, ["Newton's laws are well-known.", "A well-known result is inertia."])
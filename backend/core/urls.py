@@ -1,9 +1,13 @@
 """urls.py"""
 
 from django.urls import path
-from core.views import PasswordManagerView,UserProfileView
+from core.views import PasswordManagerView,UserProfileView,TenantConnectionView,LlmCacheView,LlmGatewayView
 
 urlpatterns = [
     path('password_manager/<str:action>', PasswordManagerView.as_view(), name='passsword_manager'),
     path('user_profile/<str:action>', UserProfileView.as_view(), name='user_profile'),
+    path('tenant_connections/<str:action>', TenantConnectionView.as_view(),
+         name='tenant_connections'),
+    path('llm_cache/<str:action>', LlmCacheView.as_view(), name='llm_cache'),
+    path('llm_gateway/<str:action>', LlmGatewayView.as_view(), name='llm_gateway'),
 ]
@@ -14,6 +14,10 @@ from django.http import HttpResponse
 from django.conf import settings
 
 from .serializers import CustomTokenObtainPairSerializer
+from core.permissions import IsSuperAdmin
+from core.common_modules.tenant_connections import TenantConnectionManager
+from core.lang_chain.extraction_cache import ExtractionCache
+from core.lang_chain.llm_gateway import LlmGateway
 from core.services.password_manager_service import PasswordManagerService
 from core.services.user_profile_service import UserProfileService
 
@@ -99,3 +103,51 @@ class UserProfileView(APIView):
         if action == 'editUserByUserName':
             return UserProfileService().edit_user_by_username(request)
         return Response({"error": "Invalid PUT action"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class TenantConnectionView(APIView):
+    """
+    View to inspect the tenant database connection budget of this worker.
+    """
+
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, action=None):
+        """
+        Get open, evicted and reopened tenant connection counts.
+        """
+        if action == 'getStats':
+            return Response(TenantConnectionManager.stats(), status=status.HTTP_200_OK)
+        return Response({"error": "Invalid GET action"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class LlmCacheView(APIView):
+    """
+    View to inspect the LLM extraction cache.
+    """
+
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, action=None):
+        """
+        Get cache hits, misses, evictions and size.
+        """
+        if action == 'getStats':
+            return Response(ExtractionCache.stats(), status=status.HTTP_200_OK)
+        return Response({"error": "Invalid GET action"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class LlmGatewayView(APIView):
+    """
+    View to inspect the LLM gateway of this worker.
+    """
+
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, action=None):
+        """
+        Get LLM call counts, retries, latency percentiles and token usage.
+        """
+        if action == 'getStats':
+            return Response(LlmGateway.instance().stats(), status=status.HTTP_200_OK)
+        return Response({"error": "Invalid GET action"}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0012_alter_schoolboardmapping_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchoolProvisioningJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('current_step', models.CharField(blank=True, max_length=50, null=True)),
+                ('completed_steps', models.JSONField(blank=True, default=list)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='provisioning_jobs', to='school.school')),
+            ],
+            options={
+                'db_table': 'school_provisioning_job',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='provisioning_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0014_schoolstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schoolsyllabusebooks',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
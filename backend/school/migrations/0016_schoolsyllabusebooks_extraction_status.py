@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+def mark_existing_ebooks_extracted(apps, schema_editor):
+    SchoolSyllabusEbooks = apps.get_model('school', 'SchoolSyllabusEbooks')
+    SchoolSyllabusEbooks.objects.using(schema_editor.connection.alias).update(
+        extraction_status='done')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0015_schoolsyllabusebooks_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schoolsyllabusebooks',
+            name='extraction_attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='schoolsyllabusebooks',
+            name='extraction_error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='schoolsyllabusebooks',
+            name='extraction_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='schoolsyllabusebooks',
+            name='extraction_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+        migrations.RunPython(mark_existing_ebooks_extracted, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0016_schoolsyllabusebooks_extraction_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EbookText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('parser', models.CharField(max_length=20)),
+                ('page_count', models.PositiveIntegerField()),
+                ('char_count', models.PositiveIntegerField()),
+                ('page_offsets', models.JSONField(default=list)),
+                ('compressed_text', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'school_syllabus_ebook_text',
+            },
+        ),
+    ]
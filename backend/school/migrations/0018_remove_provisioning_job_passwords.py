@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:00
+
+from django.db import migrations
+
+
+def remove_passwords(apps, schema_editor):
+    SchoolProvisioningJob = apps.get_model('school', 'SchoolProvisioningJob')
+    jobs = SchoolProvisioningJob.objects.using(schema_editor.connection.alias).filter(
+        payload__has_key='password')
+    for job in jobs:
+        job.payload.pop('password', None)
+        job.save(update_fields=['payload'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0017_ebooktext'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_passwords, migrations.RunPython.noop),
+    ]
@@ -50,6 +50,53 @@ class SchoolDbMetadata(models.Model):
     def __str__(self):
         return f"{self.school.name} - {self.db_name}"
     
+class SchoolProvisioningJob(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    STEPS = ('create_database', 'create_academic_year', 'copy_syllabus', 'activate_school')
+
+    school = models.ForeignKey(School, on_delete=models.CASCADE,
+                               related_name='provisioning_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    current_step = models.CharField(max_length=50, null=True, blank=True)
+    completed_steps = models.JSONField(default=list, blank=True)
+    payload = models.JSONField(default=dict, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'school_provisioning_job'
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='provisioning_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.school_id} - {self.status}"
+
+class SchoolStats(models.Model):
+    """Per-school counters kept in the default DB so listings never query the school DBs."""
+    school = models.OneToOneField(School, on_delete=models.CASCADE,
+                                  related_name='stats')
+    teacher_count = models.PositiveIntegerField(default=0)
+    student_count = models.PositiveIntegerField(default=0)
+    class_count = models.PositiveIntegerField(default=0)
+    section_count = models.PositiveIntegerField(default=0)
+    enrollment_count = models.PositiveIntegerField(default=0)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'school_stats'
+
+    def __str__(self):
+        return f"{self.school_id} - stats"
+
 class SchoolBoard(models.Model):
     board_name = models.CharField(max_length=255, unique=True)
     is_active = models.BooleanField(default=True)
@@ -91,6 +138,17 @@ class SchoolSyllabusEbooks(models.Model):
     ])
     ebook_name = models.CharField(max_length=255)
     file_path = models.CharField(max_length=500)
+    # SHA-256 of the PDF; identical uploads share one S3 object and one extraction
+    content_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    extraction_status = models.CharField(max_length=20, default='pending', choices=[
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ])
+    extraction_attempts = models.PositiveIntegerField(default=0)
+    extraction_error = models.TextField(null=True, blank=True)
+    extraction_started_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -98,6 +156,24 @@ class SchoolSyllabusEbooks(models.Model):
         db_table = 'school_syllabus_ebooks'
         unique_together = ('board', 'subject', 'class_number', 'ebook_name')
 
+class EbookText(models.Model):
+    """Extracted page text of a PDF, shared by every eBook with the same content hash."""
+    content_hash = models.CharField(max_length=64, unique=True)
+    parser = models.CharField(max_length=20)
+    page_count = models.PositiveIntegerField()
+    char_count = models.PositiveIntegerField()
+    # Start offset of each page in the decompressed text
+    page_offsets = models.JSONField(default=list)
+    # zlib-compressed UTF-8 text of all pages, concatenated
+    compressed_text = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'school_syllabus_ebook_text'
+
+    def __str__(self):
+        return f"{self.content_hash} - {self.page_count} pages"
+
 class AcademicYear(AbstractAcademicYear):
     class Meta:
         db_table = 'school_academic_year'
@@ -0,0 +1,195 @@
+"""School provisioning service module"""
+
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from rest_framework.response import Response
+from rest_framework import status
+
+from core.common_modules.db_loader import DbLoader
+
+from school.models import SchoolDbMetadata, SchoolProvisioningJob, SchoolStats
+
+from academics.models import SchoolAcademicYear
+
+from syllabus.models import SchoolChapter
+from syllabus.services.ebook_service import EbookService
+
+logger = logging.getLogger(__name__)
+
+
+class SchoolProvisioningService:
+    """
+    Service to provision a school's database in resumable background steps.
+
+    Each completed step is recorded on the SchoolProvisioningJob row, so a job
+    interrupted by a crash or a failure resumes from the first unfinished step.
+    Steps are written to be safe to re-run.
+    """
+
+    def enqueue(self, school, payload):
+        """Create a provisioning job and start it once the surrounding transaction commits."""
+        job = SchoolProvisioningJob.objects.create(school=school, payload=payload)
+        if settings.PROVISIONING_CONFIG['RUN_IN_PROCESS']:
+            transaction.on_commit(lambda: self.start_in_background(job.id))
+        return job
+
+    def start_in_background(self, job_id):
+        """Run a job on a daemon thread of this worker."""
+        thread = threading.Thread(target=self.run_job_by_id, args=(job_id,), daemon=True,
+                                  name=f"school-provisioning-{job_id}")
+        thread.start()
+
+    def run_job_by_id(self, job_id):
+        try:
+            job = self.claim_job(job_id=job_id)
+            if job:
+                self.run_job(job)
+        finally:
+            connections.close_all()
+
+    def claim_job(self, job_id=None):
+        """
+        Claim the next runnable job (or a specific one) for this worker.
+        Jobs left 'running' by a worker that died are reclaimed after a lease timeout.
+        """
+        stale_before = timezone.now() - timedelta(
+            seconds=settings.PROVISIONING_CONFIG['LEASE_SECONDS'])
+        with transaction.atomic():
+            jobs = SchoolProvisioningJob.objects.select_for_update(skip_locked=True).filter(
+                Q(status='pending') | Q(status='running', updated_at__lt=stale_before)
+            )
+            if job_id is not None:
+                jobs = jobs.filter(pk=job_id)
+            job = jobs.order_by('created_at').first()
+            if not job:
+                return None
+            job.status = 'running'
+            job.attempts += 1
+            job.error = None
+            job.save(update_fields=['status', 'attempts', 'error', 'updated_at'])
+            return job
+
+    def run_job(self, job):
+        """Run every unfinished step of a claimed job."""
+        logger.info(f"Provisioning school {job.school_id} (job {job.id}, attempt {job.attempts})")
+        try:
+            for step in SchoolProvisioningJob.STEPS:
+                if step in job.completed_steps:
+                    continue
+                job.current_step = step
+                job.save(update_fields=['current_step', 'updated_at'])
+
+                getattr(self, f'step_{step}')(job)
+
+                job.completed_steps = job.completed_steps + [step]
+                job.save(update_fields=['completed_steps', 'payload', 'updated_at'])
+                logger.info(f"Provisioning step {step} completed for school {job.school_id}")
+
+            job.status = 'completed'
+            job.current_step = None
+            job.save(update_fields=['status', 'current_step', 'updated_at'])
+            logger.info(f"School {job.school_id} provisioned successfully.")
+        except Exception as e:
+            logger.exception(f"Provisioning step {job.current_step} failed for school {job.school_id}: {e}")
+            retry = job.attempts < settings.PROVISIONING_CONFIG['MAX_ATTEMPTS']
+            job.status = 'pending' if retry else 'failed'
+            job.error = str(e)
+            job.save(update_fields=['status', 'error', 'updated_at'])
+            if retry and settings.PROVISIONING_CONFIG['RUN_IN_PROCESS']:
+                self.schedule_retry(job)
+        return job
+
+    def schedule_retry(self, job):
+        """
+        Run a failed job again on this worker after an exponential backoff.
+        If the process exits first, the pending job waits for a `run_school_provisioning` worker.
+        """
+        delay = settings.PROVISIONING_CONFIG['RETRY_DELAY_SECONDS'] * 2 ** (job.attempts - 1)
+        logger.info(f"Retrying provisioning job {job.id} in {delay}s")
+        timer = threading.Timer(delay, self.start_in_background, args=(job.id,))
+        timer.daemon = True
+        timer.start()
+
+    def step_create_database(self, job):
+        from school.services.school_service import SchoolService
+
+        school_db_metadata = SchoolDbMetadata.objects.get(school_id=job.school_id)
+        if not SchoolService().create_school_database(school_db_metadata):
+            raise Exception("Failed to create database for school.")
+
+    def step_create_academic_year(self, job):
+        school_db_metadata = SchoolDbMetadata.objects.get(school_id=job.school_id)
+        school_db_name = DbLoader().register_school_database(school_db_metadata.db_name)
+        academic_year, _ = SchoolAcademicYear.objects.using(school_db_name).get_or_create(
+            start_year=job.payload.get('academic_start_year'),
+            end_year=job.payload.get('academic_end_year'),
+        )
+        job.payload = {**job.payload, 'academic_year_id': academic_year.id}
+
+    def step_copy_syllabus(self, job):
+        school_db_metadata = SchoolDbMetadata.objects.get(school_id=job.school_id)
+        school_db_name = DbLoader().register_school_database(school_db_metadata.db_name)
+        academic_year_id = job.payload.get('academic_year_id')
+        if SchoolChapter.objects.using(school_db_name).filter(
+                academic_year_id=academic_year_id).exists():
+            logger.info(f"Syllabus already copied for school {job.school_id}.")
+            return
+        if not EbookService().copy_syllabus_data_to_school_db(school_db_metadata, academic_year_id):
+            raise Exception("Failed to copy syllabus data to school database.")
+
+    def step_activate_school(self, job):
+        school_db_metadata = SchoolDbMetadata.objects.get(school_id=job.school_id)
+        school_db_metadata.is_active = True
+        school_db_metadata.save(update_fields=['is_active', 'updated_at'])
+        SchoolStats.objects.get_or_create(school_id=job.school_id)
+
+    def get_job_status(self, request):
+        """
+        Get the step-by-step progress of a school provisioning job.
+        Args:
+            request: The HTTP request containing the job ID.
+        Returns:
+            Response: A response with the job status.
+        """
+        try:
+            job_id = request.query_params.get('job_id')
+            if not job_id:
+                return Response({"error": "Job id is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+            job = SchoolProvisioningJob.objects.get(pk=job_id)
+
+            steps = []
+            for step in SchoolProvisioningJob.STEPS:
+                if step in job.completed_steps:
+                    step_status = 'completed'
+                elif step == job.current_step:
+                    step_status = 'failed' if job.status == 'failed' else job.status
+                else:
+                    step_status = 'pending'
+                steps.append({"step": step, "status": step_status})
+
+            job_data = {
+                "job_id": job.id,
+                "school_id": job.school_id,
+                "status": job.status,
+                "current_step": job.current_step,
+                "steps": steps,
+                "attempts": job.attempts,
+                "error": job.error,
+                "created_at": job.created_at,
+                "updated_at": job.updated_at,
+            }
+            return Response({"job": job_data}, status=status.HTTP_200_OK)
+        except SchoolProvisioningJob.DoesNotExist:
+            logger.error(f"Provisioning job with id {job_id} does not exist.")
+            return Response({"error": "Provisioning job not found."}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error("Error while fetching provisioning job status.")
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -5,25 +5,21 @@ import psycopg2
 import redis
 from django.db import transaction,IntegrityError
 from django.conf import settings
-from django.test.utils import override_settings
-from django.apps import apps
-from django.core.management import call_command
 
 from rest_framework.response import Response
 from rest_framework import status
 
 from core.models import User,Role
 from core.common_modules.db_loader import DbLoader
-from core.common_modules.send_email import EmailService
+from core.common_modules.tenant_migrations import TenantMigrator
+from core.common_modules.tenant_template import TenantTemplate
 from core.common_modules.password_validator import is_valid_password
-
-from teacher.models import Teacher
+from core.common_modules.send_email import EmailService
 
 from school.models import School, SchoolDbMetadata, SchoolBoard, SchoolBoardMapping
 
-from academics.models import SchoolAcademicYear
-
-from syllabus.services.ebook_service import EbookService
+from school.services.provisioning_service import SchoolProvisioningService
+from school.services.school_stats_service import SchoolStatsService
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +33,8 @@ class SchoolService:
     def create_school(self, request):
         """
         Create a school with the provided data.
+        The school's database is provisioned by a background job; the response
+        carries the job id to poll for progress.
         Args:
             request: The HTTP request containing school data.
         Returns:
@@ -87,40 +85,34 @@ class SchoolService:
                 admin_user.school_id = school.pk
                 admin_user.save()
 
-                school_db_metadata = SchoolDbMetadata.objects.create(
+                # The school stays inactive until its database is provisioned
+                SchoolDbMetadata.objects.create(
                     school = school,
                     db_name = f'{school.name.lower().replace(" ", "_")}_{school.pk}_db',
                     db_user = settings.DB_CONFIG['USER'],
                     db_password = settings.DB_CONFIG['PASSWORD'],
                     db_host = settings.DB_CONFIG['HOST'],
-                    db_port = settings.DB_CONFIG['PORT']
+                    db_port = settings.DB_CONFIG['PORT'],
+                    is_active = False
                 )
 
-                success = self.create_school_database(school_db_metadata)
-
-                if not success:
-                    logger.error("Database creation failed. Rolling back transaction.")
-                    raise Exception("Failed to create database for school.")
-
-                academic_year = SchoolAcademicYear.objects.using(school_db_metadata.db_name).create(
-                    start_year=data.get('academic_start_year'),
-                    end_year=data.get('academic_end_year'),
-                )
-
-                email_service = EmailService()
-                email_service.send_email(
-                    to_email=admin_user.email,
-                    email_type='welcome',
-                    name = school.name,
-                    user_name=admin_user.user_name,
-                    password=data.get('password'),
-                )
-            DbLoader().load_databases()
-            copy_status = EbookService().copy_syllabus_data_to_school_db(school_db_metadata,
-                                                                         academic_year.id)
-            if not copy_status:
-                logger.error("Failed to copy syllabus data to school database.")
-            return Response({"message": "School created successfully."}, status=status.HTTP_201_CREATED)
+                job = SchoolProvisioningService().enqueue(school, {
+                    'academic_start_year': data.get('academic_start_year'),
+                    'academic_end_year': data.get('academic_end_year'),
+                })
+                # The password only lives in this request: it is never written to the job
+                password = data.get('password')
+                transaction.on_commit(
+                    lambda: self.send_welcome_email(school, admin_user, password))
+            # The school is inactive until the job completes; clients poll its status
+            return Response({
+                "message": "School creation started. The school stays inactive until provisioning "
+                           "completes; poll getProvisioningStatus with the job_id for progress.",
+                "school_id": school.id,
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": f"/school/manage_school/getProvisioningStatus?job_id={job.id}",
+            }, status=status.HTTP_202_ACCEPTED)
 
         except Role.DoesNotExist:
             logger.error("Role 'admin' does not exist.")
@@ -148,6 +140,20 @@ class SchoolService:
             logger.error("Error while creating school. Error: %s", str(e))
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @staticmethod
+    def send_welcome_email(school, admin_user, password):
+        """Email the admin their credentials; a failure doesn't undo the school creation."""
+        try:
+            EmailService().send_email(
+                to_email=admin_user.email,
+                email_type='welcome',
+                name = school.name,
+                user_name=admin_user.user_name,
+                password=password,
+            )
+        except Exception as e:
+            logger.error(f"Failed to send welcome email for school {school.id}: {e}")
+
     def edit_school(self, request):
         """
         Edit an existing school.
@@ -196,24 +202,21 @@ class SchoolService:
             Response: A response with the list of schools.
         """
         try:
-            schools = School.objects.all()
+            schools = School.objects.select_related(
+                'school_admin', 'metadata', 'stats'
+            ).filter(metadata__isnull=False)
+
             schools_data = []
             for school in schools:
-                school_db_metadata = SchoolDbMetadata.objects.filter(school=school).first()
-
-                if school_db_metadata:
-                    school_db_name = school_db_metadata.db_name
-                else:
-                    continue
-                teacher_count = Teacher.objects.using(school_db_name).filter(is_active=True).count()
-
+                stats = getattr(school, 'stats', None)
+                is_active = school.is_active and school.metadata.is_active
                 schools_data.append({
                     "school_id": school.id,
                     "school_name": school.name,
                     "school_address": school.address,
                     "school_contact_number": school.contact_number,
                     "school_email": school.email if school.school_admin else None,
-                    "teacher_count": teacher_count,
+                    "teacher_count": stats.teacher_count if stats and is_active else 0,
                 })
             return Response({"schools": schools_data}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -233,7 +236,8 @@ class SchoolService:
             if not school_id:
                 return Response({"error": "School id is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-            school = School.objects.get(pk=school_id)
+            school = School.objects.select_related('school_admin', 'stats').get(pk=school_id)
+            stats = getattr(school, 'stats', None)
 
             school_data = {
                 "school_id": school.id,
@@ -245,6 +249,10 @@ class SchoolService:
                 "school_admin_email": school.school_admin.email if school.school_admin else None,
                 "school_admin_full_name" : f"{school.school_admin.first_name} {school.school_admin.last_name}" if school.school_admin else None,
                 "school_admin_phone_number": school.school_admin.phone_number if school.school_admin else None,
+                "stats": {
+                    counter: getattr(stats, counter) if stats else 0
+                    for counter in SchoolStatsService.COUNTERS
+                },
             }
             return Response({"school": school_data}, status=status.HTTP_200_OK)
         except School.DoesNotExist:
@@ -274,6 +282,8 @@ class SchoolService:
     def create_school_database(self, school_db_metadata):
         """
         Create a database for the school.
+        New databases are cloned from the tenant template database when enabled.
+        In schema mode a schema is created inside the default database instead.
         Args:
             school: The School object for which the database is to be created.
         Returns:
@@ -282,6 +292,9 @@ class SchoolService:
         try:
             logger.info(f"Creating database for school: {school_db_metadata.db_name}")
 
+            schema_mode = DbLoader.is_schema_mode()
+            use_template = not schema_mode and settings.TENANT_DB_CONFIG['USE_TEMPLATE_DB']
+
             conn = psycopg2.connect(
                 dbname=settings.DB_CONFIG['NAME'],
                 user=settings.DB_CONFIG['USER'],
@@ -292,22 +305,27 @@ class SchoolService:
             conn.autocommit = True
             cursor = conn.cursor()
 
-            cursor.execute(f'CREATE DATABASE "{school_db_metadata.db_name}"')
+            # Safe to re-run: an existing database is only brought up to date
+            if schema_mode:
+                cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{school_db_metadata.db_name}"')
+                exists = False
+            else:
+                cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s",
+                               [school_db_metadata.db_name])
+                exists = cursor.fetchone() is not None
+                if not exists and not use_template:
+                    cursor.execute(f'CREATE DATABASE "{school_db_metadata.db_name}"')
 
             cursor.close()
             conn.close()
 
-            db_loader = DbLoader()
-            db_loader.load_dynamic_databases(
-                db_key = school_db_metadata.db_name,
-                engine = settings.DB_CONFIG['ENGINE'],
-                name = school_db_metadata.db_name,
-                user = settings.DB_CONFIG['USER'],
-                password = settings.DB_CONFIG['PASSWORD'],
-                host = settings.DB_CONFIG['HOST'],
-                port = settings.DB_CONFIG['PORT']
-            )
-            self.apply_db_migrations(school_db_metadata.db_name)
+            if use_template and not exists:
+                # Clone the pre-migrated template instead of replaying every migration
+                TenantTemplate().create_database(school_db_metadata.db_name)
+                DbLoader().register_school_database(school_db_metadata.db_name)
+            else:
+                school_db_name = DbLoader().register_school_database(school_db_metadata.db_name)
+                self.apply_db_migrations(school_db_name)
 
             logger.info(f"Database {school_db_metadata.db_name} created successfully.")
             return True
@@ -315,23 +333,17 @@ class SchoolService:
             logger.error(f"Failed to create database for school {school_db_metadata.db_name}: {str(e)}")
             return False
     
-    def apply_db_migrations(self,db_name,
-                            exclude_apps=('core', 'auth',
-                'admin', 'contenttypes', 'sessions','school')
-    ):
+    def apply_db_migrations(self,db_name):
         """
-        Apply migrations to the specified database, excluding certain apps.
+        Apply every pending migration to the specified database in a single pass.
+        Models of the default-only apps are skipped by the database router.
         Args:
             db_name (str): The name of the database to apply migrations to.
-            exclude_apps (tuple): A tuple of app labels to exclude from migrations.
         """
-        # Get all app labels except excluded ones
-        app_labels = [app.label for app in apps.get_app_configs() if app.label not in exclude_apps]
-
-        for app_label in app_labels:
-            try:
-                with override_settings(CURRENT_MIGRATION_DB=db_name):
-                    call_command('migrate', database=db_name, app_label=app_label, interactive=False)
-                    logger.info(f"Migrated {app_label} on {db_name}")
-            except Exception as e:
-                logger.error(f"Migration failed for {app_label} on {db_name}: {e}")
+        try:
+            TenantMigrator.migrate(db_name)
+            logger.info(f"Migrated {db_name}")
+        except Exception as e:
+            # A half-migrated database must fail its provisioning step, not be activated
+            logger.error(f"Migration failed on {db_name}: {e}")
+            raise
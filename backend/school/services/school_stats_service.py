@@ -0,0 +1,110 @@
+"""School stats service module"""
+
+import logging
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from core.common_modules.db_loader import DbLoader
+from core.common_modules.tenant_fanout import TenantFanout
+from core.common_modules.tenant_registry import TenantRegistry
+
+from school.models import SchoolStats
+
+from teacher.models import Teacher
+from student.models import Student, StudentClassAssignment
+from classes.models import SchoolSection
+
+logger = logging.getLogger(__name__)
+
+
+class SchoolStatsService:
+    """
+    Keep the SchoolStats counters of the default DB in step with the school DBs.
+
+    Counters are adjusted incrementally from model signals once the school DB
+    transaction commits. Writes that bypass signals (bulk operations, raw SQL,
+    manual fixes) are corrected by `reconcile_school_stats`.
+    """
+
+    COUNTERS = ('teacher_count', 'student_count', 'class_count',
+                'section_count', 'enrollment_count')
+
+    @staticmethod
+    def get_school_id_for_alias(alias):
+        """Map the alias a tenant row was written through to its school."""
+        db_name = alias
+        if DbLoader.is_schema_mode() and alias == settings.TENANT_DB_CONFIG['SCHEMA_ALIAS']:
+            db_name = getattr(connections[alias], 'tenant_schema', None)
+        entry = TenantRegistry.get_by_db_name(db_name) if db_name else None
+        return entry.school_id if entry else None
+
+    def apply_delta(self, alias, **deltas):
+        """Adjust counters once the tenant transaction on `alias` commits."""
+        school_id = self.get_school_id_for_alias(alias)
+        if school_id is None:
+            return
+        transaction.on_commit(lambda: self._update(school_id, deltas), using=alias)
+
+    def refresh_sections(self, alias):
+        """Recount sections and classes (a class counts once whatever its sections)."""
+        school_id = self.get_school_id_for_alias(alias)
+        if school_id is None:
+            return
+
+        def refresh():
+            # Resolve the alias again: in schema mode the search_path may have moved on
+            db_name = TenantRegistry.get_db_name(school_id, active_only=False)
+            if db_name is None:
+                return
+            tenant_alias = DbLoader().register_school_database(db_name)
+            sections = SchoolSection.objects.using(tenant_alias)
+            self._set(school_id, {
+                'section_count': sections.count(),
+                'class_count': sections.values('class_instance').distinct().count(),
+            })
+        transaction.on_commit(refresh, using=alias)
+
+    def _update(self, school_id, deltas):
+        try:
+            SchoolStats.objects.get_or_create(school_id=school_id)
+            SchoolStats.objects.filter(school_id=school_id).update(**{
+                field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()
+            })
+        except Exception as e:
+            logger.error(f"Error updating stats for school {school_id}: {e}")
+
+    def _set(self, school_id, values):
+        try:
+            SchoolStats.objects.update_or_create(school_id=school_id, defaults=values)
+        except Exception as e:
+            logger.error(f"Error updating stats for school {school_id}: {e}")
+
+    @staticmethod
+    def count_school(alias):
+        """Recompute every counter from a school's database."""
+        sections = SchoolSection.objects.using(alias)
+        return {
+            'teacher_count': Teacher.objects.using(alias).filter(is_active=True).count(),
+            'student_count': Student.objects.using(alias).filter(is_active=True).count(),
+            'class_count': sections.values('class_instance').distinct().count(),
+            'section_count': sections.count(),
+            'enrollment_count': StudentClassAssignment.objects.using(alias).count(),
+        }
+
+    def reconcile(self, tenants=None):
+        """
+        Recompute the counters of the given (default: all active) schools.
+        Returns:
+            FanoutResult: Counters by school id plus the schools that failed.
+        """
+        if tenants is None:
+            tenants = [tenant for tenant in TenantRegistry.all() if tenant.is_active]
+        outcome = TenantFanout().run(self.count_school, tenants)
+        now = timezone.now()
+        for school_id, counts in outcome.results.items():
+            self._set(school_id, {**counts, 'reconciled_at': now})
+        return outcome
@@ -0,0 +1,81 @@
+"""School signals module"""
+
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from school.models import School, SchoolDbMetadata
+from school.services.school_stats_service import SchoolStatsService
+from core.common_modules.tenant_registry import TenantRegistry
+
+from teacher.models import Teacher
+from student.models import Student, StudentClassAssignment
+from classes.models import SchoolSection
+
+
+@receiver(post_save, sender=School)
+@receiver(post_delete, sender=School)
+def invalidate_school_tenant(sender, instance, **kwargs):
+    """Refresh the tenant registry when a school changes."""
+    transaction.on_commit(lambda: TenantRegistry.invalidate(instance.pk))
+
+
+@receiver(post_save, sender=SchoolDbMetadata)
+@receiver(post_delete, sender=SchoolDbMetadata)
+def invalidate_school_db_metadata_tenant(sender, instance, **kwargs):
+    """Refresh the tenant registry when a school's database metadata changes."""
+    transaction.on_commit(lambda: TenantRegistry.invalidate(instance.school_id))
+
+
+# School stats: rows of the tenant models below adjust the SchoolStats counters.
+# Soft deletes flip is_active, so the value loaded from the DB is remembered.
+
+@receiver(post_init, sender=Teacher)
+@receiver(post_init, sender=Student)
+def remember_is_active(sender, instance, **kwargs):
+    # Read __dict__ so a deferred is_active isn't fetched for every loaded row
+    instance._stats_is_active = instance.__dict__.get('is_active') if instance.pk else None
+
+
+@receiver(post_save, sender=Teacher)
+@receiver(post_save, sender=Student)
+def count_active_member(sender, instance, created, using, **kwargs):
+    """Adjust the teacher/student count on create, soft delete and reactivation."""
+    previous = getattr(instance, '_stats_is_active', None)
+    instance._stats_is_active = instance.is_active
+    if created:
+        delta = 1 if instance.is_active else 0
+    elif previous is None:
+        # Loaded without is_active: left to the reconciliation command
+        return
+    else:
+        delta = int(instance.is_active) - int(previous)
+    if delta:
+        counter = 'teacher_count' if sender is Teacher else 'student_count'
+        SchoolStatsService().apply_delta(using, **{counter: delta})
+
+
+@receiver(post_delete, sender=Teacher)
+@receiver(post_delete, sender=Student)
+def uncount_active_member(sender, instance, using, **kwargs):
+    if instance.is_active:
+        counter = 'teacher_count' if sender is Teacher else 'student_count'
+        SchoolStatsService().apply_delta(using, **{counter: -1})
+
+
+@receiver(post_save, sender=SchoolSection)
+@receiver(post_delete, sender=SchoolSection)
+def count_sections(sender, instance, using, **kwargs):
+    if kwargs.get('created', True):
+        SchoolStatsService().refresh_sections(using)
+
+
+@receiver(post_save, sender=StudentClassAssignment)
+def count_enrollment(sender, instance, created, using, **kwargs):
+    if created:
+        SchoolStatsService().apply_delta(using, enrollment_count=1)
+
+
+@receiver(post_delete, sender=StudentClassAssignment)
+def uncount_enrollment(sender, instance, using, **kwargs):
+    SchoolStatsService().apply_delta(using, enrollment_count=-1)
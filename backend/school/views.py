@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from school.services.school_service import SchoolService
+from school.services.provisioning_service import SchoolProvisioningService
 
 
 class SchoolActionView(APIView):
@@ -15,6 +16,7 @@ class SchoolActionView(APIView):
     Paths Available:
     - GET /school/school_list/ - List all schools (super admin only)
     - GET /school/board_list/ - List all school boards (super admin only)
+    - GET /school/getProvisioningStatus/ - Step-by-step progress of a school creation job
 
     - POST /school/create/ - Create a new school (super admin only)
     
@@ -34,6 +36,8 @@ class SchoolActionView(APIView):
             return SchoolService().get_boards(request)
         elif action == 'getSchoolById':
             return SchoolService().get_school(request)
+        elif action == 'getProvisioningStatus':
+            return SchoolProvisioningService().get_job_status(request)
         return Response({"error": "Invalid GET action"}, status=status.HTTP_400_BAD_REQUEST)
 
     def post(self, request, action=None):
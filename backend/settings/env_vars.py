@@ -13,6 +13,10 @@ AWS_CONFIG = {
     'REGION_NAME': os.getenv('AWS_REGION_NAME', 'us-east-1'),
     'AWS_ACCESS_KEY_ID': os.getenv('AWS_ACCESS_KEY_ID', ''),
     'AWS_SECRET_ACCESS_KEY': os.getenv('AWS_SECRET_ACCESS_KEY', ''),
+    # Multipart upload tuning (sizes in MB)
+    'MULTIPART_THRESHOLD_MB': int(os.getenv('AWS_S3_MULTIPART_THRESHOLD_MB', 16)),
+    'MULTIPART_CHUNK_SIZE_MB': int(os.getenv('AWS_S3_MULTIPART_CHUNK_SIZE_MB', 16)),
+    'MAX_CONCURRENCY': int(os.getenv('AWS_S3_MAX_CONCURRENCY', 8)),
 }
 
 DB_CONFIG = {
@@ -40,4 +44,79 @@ API_KEYS = {
 
 AI_MODELS = {
     'GEMINI_MODEL': os.getenv('GEMINI_MODEL', 'gemini-2.5-flash')
-}
\ No newline at end of file
+}
+
+PDF_EXTRACTION_CONFIG = {
+    # 'pypdf2', or the faster 'pypdf' / 'pymupdf' when installed
+    'PARSER': os.getenv('PDF_PARSER', 'pypdf2'),
+    # Processes parsing page ranges of one PDF (0 = one per CPU)
+    'WORKERS': int(os.getenv('PDF_EXTRACTION_WORKERS', 0)),
+    # Smaller PDFs are parsed in the calling process
+    'MIN_PAGES_FOR_POOL': int(os.getenv('PDF_MIN_PAGES_FOR_POOL', 40)),
+}
+
+LLM_CONFIG = {
+    # Textbooks are split into chunks of at most this many (estimated) tokens
+    'CHUNK_TOKEN_BUDGET': int(os.getenv('LLM_CHUNK_TOKEN_BUDGET', 30000)),
+    # Chunks of one textbook sent to the model at the same time
+    'CHUNK_CONCURRENCY': int(os.getenv('LLM_CHUNK_CONCURRENCY', 4)),
+    # Strip repeated headers/footers, page numbers and hyphenation before prompting
+    'NORMALIZE_TEXT': os.getenv('LLM_NORMALIZE_TEXT', 'true').lower() == 'true',
+    # Parsed extraction results kept in llm_extraction_cache (least recently used evicted)
+    'CACHE_ENABLED': os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true',
+    'CACHE_MAX_ENTRIES': int(os.getenv('LLM_CACHE_MAX_ENTRIES', 5000)),
+    # 'gemini' calls the model; 'stub' replays recorded responses for offline load tests
+    'BACKEND': os.getenv('LLM_BACKEND', 'gemini'),
+    # Process-wide limits of the LLM gateway
+    'RATE_LIMIT_PER_MINUTE': int(os.getenv('LLM_RATE_LIMIT_PER_MINUTE', 60)),
+    'MAX_CONCURRENCY': int(os.getenv('LLM_MAX_CONCURRENCY', 8)),
+    'MAX_RETRIES': int(os.getenv('LLM_MAX_RETRIES', 3)),
+    'RETRY_BACKOFF_SECONDS': float(os.getenv('LLM_RETRY_BACKOFF_SECONDS', 2)),
+    # Recorded responses, one <sha256 of prompt>.txt file per prompt
+    'STUB_RESPONSES_DIR': os.getenv('LLM_STUB_RESPONSES_DIR', 'llm_responses'),
+    'STUB_LATENCY_SECONDS': float(os.getenv('LLM_STUB_LATENCY_SECONDS', 0)),
+    # Save the responses of the real model into STUB_RESPONSES_DIR
+    'RECORD_RESPONSES': os.getenv('LLM_RECORD_RESPONSES', 'false').lower() == 'true',
+}
+
+TENANT_DB_CONFIG = {
+    # 'database': one database per school, 'schema': one schema per school in the default database
+    'ISOLATION_MODE': os.getenv('TENANT_ISOLATION_MODE', 'database'),
+    'SCHEMA_ALIAS': os.getenv('TENANT_SCHEMA_ALIAS', 'tenants'),
+    'USE_TEMPLATE_DB': os.getenv('TENANT_USE_TEMPLATE_DB', 'true').lower() == 'true',
+    'TEMPLATE_DB_NAME': os.getenv('TENANT_TEMPLATE_DB_NAME',
+                                  f"{DB_CONFIG['NAME']}_tenant_template"),
+    'CONN_MAX_AGE': int(os.getenv('TENANT_DB_CONN_MAX_AGE', 300)),
+    'MAX_OPEN_CONNECTIONS': int(os.getenv('TENANT_DB_MAX_OPEN_CONNECTIONS', 100)),
+    'REGISTRY_VERSION_CHECK_INTERVAL': float(os.getenv('TENANT_REGISTRY_VERSION_CHECK_INTERVAL', 5)),
+    # Cross-school reports (see TenantFanout)
+    'FANOUT_MAX_WORKERS': int(os.getenv('TENANT_FANOUT_MAX_WORKERS', 16)),
+    'FANOUT_TIMEOUT_SECONDS': float(os.getenv('TENANT_FANOUT_TIMEOUT_SECONDS', 5)),
+}
+
+PROVISIONING_CONFIG = {
+    # Run jobs on a thread of the web worker that accepted them, in addition to
+    # any `run_school_provisioning` worker processes
+    'RUN_IN_PROCESS': os.getenv('PROVISIONING_RUN_IN_PROCESS', 'true').lower() == 'true',
+    'MAX_ATTEMPTS': int(os.getenv('PROVISIONING_MAX_ATTEMPTS', 3)),
+    'LEASE_SECONDS': int(os.getenv('PROVISIONING_LEASE_SECONDS', 900)),
+    'POLL_INTERVAL': float(os.getenv('PROVISIONING_POLL_INTERVAL', 5)),
+    # Backoff before an in-process retry, doubled on every attempt
+    'RETRY_DELAY_SECONDS': float(os.getenv('PROVISIONING_RETRY_DELAY_SECONDS', 30)),
+}
+
+EXTRACTION_CONFIG = {
+    # Run eBook extraction on a thread of the web worker that took the upload, in
+    # addition to any `run_ebook_extraction` worker processes
+    'RUN_IN_PROCESS': os.getenv('EXTRACTION_RUN_IN_PROCESS', 'true').lower() == 'true',
+    'MAX_ATTEMPTS': int(os.getenv('EXTRACTION_MAX_ATTEMPTS', 3)),
+    'LEASE_SECONDS': int(os.getenv('EXTRACTION_LEASE_SECONDS', 1800)),
+    'POLL_INTERVAL': float(os.getenv('EXTRACTION_POLL_INTERVAL', 5)),
+    # Backoff before an in-process retry, doubled on every attempt
+    'RETRY_DELAY_SECONDS': float(os.getenv('EXTRACTION_RETRY_DELAY_SECONDS', 60)),
+}
+
+PAGINATION_CONFIG = {
+    'DEFAULT_PAGE_SIZE': int(os.getenv('PAGINATION_DEFAULT_PAGE_SIZE', 100)),
+    'MAX_PAGE_SIZE': int(os.getenv('PAGINATION_MAX_PAGE_SIZE', 500)),
+}
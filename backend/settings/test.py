@@ -10,4 +10,10 @@ CACHES = {
             'BACKEND': 'django.core.cache.backends.redis.RedisCache',
             'LOCATION': 'redis://127.0.0.1:6379/1',
         }
-    }
\ No newline at end of file
+    }
+
+# Stand-in school database for the test suite: tenant apps only migrate off the default DB
+DATABASES['school_test'] = {
+    **DATABASES['default'],
+    'TEST': {'NAME': 'test_school_db'},
+}
@@ -5,6 +5,7 @@ updating, and retrieving student data."""
 import logging
 
 from django.db import transaction,IntegrityError
+from django.db.models import QuerySet
 from django.http import JsonResponse
 
 from rest_framework import status
@@ -15,6 +16,8 @@ from classes.models import SchoolSection
 from academics.models import SchoolAcademicYear
 
 from core.common_modules.common_functions import CommonFunctions
+from core.common_modules.user_directory import UserDirectory
+from core.common_modules.pagination import KeysetPaginator, InvalidCursor
 from core.models import User,Role
 
 
@@ -286,10 +289,26 @@ class StudentService:
                                     status=status.HTTP_404_NOT_FOUND)
 
             students = Student.objects.using(self.school_db_name).all()
+            is_active = request.GET.get('is_active')
+            if is_active is not None:
+                students = students.filter(is_active=is_active.lower() == 'true')
+            if request.GET.get('class_id'):
+                students = students.filter(
+                    studentclassassignment__class_instance_id=request.GET.get('class_id'),
+                    studentclassassignment__academic_year_id=academic_year_id,
+                )
+            if request.GET.get('roll_number'):
+                students = students.filter(roll_number=request.GET.get('roll_number'))
+
+            paginator = KeysetPaginator.from_request(request)
+            students, next_cursor = paginator.paginate(students)
 
             students_data = self.get_students_data(students,academic_year_id)
 
-            return JsonResponse({"students": students_data}, status=status.HTTP_200_OK)
+            return JsonResponse({"students": students_data, "next_cursor": next_cursor},
+                                status=status.HTTP_200_OK)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as ve:
             logger.error(f"Value error: {ve}")
             return JsonResponse({"error": str(ve)},
@@ -455,31 +474,36 @@ class StudentService:
                                 status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def get_students_data(self,students,academic_year_id):
-        """Helper method to format student data."""
+        """
+        Helper method to format student data.
+        Students, their class assignment for the academic year and the section
+        are read in one joined query; their users come from one bulk fetch.
+        """
         try:
+            if not SchoolAcademicYear.objects.using(self.school_db_name).filter(
+                    id=academic_year_id).exists():
+                raise SchoolAcademicYear.DoesNotExist
+
+            if not isinstance(students, QuerySet):
+                students = [student.id for student in students]
+            assignments = list(
+                StudentClassAssignment.objects.using(self.school_db_name).filter(
+                    student__in=students,
+                    academic_year_id=academic_year_id,
+                ).select_related('student', 'class_instance').order_by('student_id')
+            )
+
+            user_directory = UserDirectory.current()
+            user_directory.prefetch(assignment.student.student_id for assignment in assignments)
+
             students_data = []
-            
-            academic_year = SchoolAcademicYear.objects.using(self.school_db_name).get(id=academic_year_id)
-            for student in students:
-                try:
-                    user = User.objects.get(id=student.student_id)
-                    class_assignment = StudentClassAssignment.objects.using(
-                        self.school_db_name
-                    ).get(
-                        student=student,
-                        academic_year = academic_year
-                    )
-                    class_instance = SchoolSection.objects.using(self.school_db_name).get(
-                        id=class_assignment.class_instance_id)
-                except User.DoesNotExist:
+            for assignment in assignments:
+                student = assignment.student
+                class_instance = assignment.class_instance
+                user = user_directory.get(student.student_id)
+                if user is None:
                     logger.warning(f"User with ID {student.student_id} not found.")
                     continue
-                except StudentClassAssignment.DoesNotExist:
-                    logger.warning(f"Class assignment for student ID {student.student_id} not found.")
-                    continue
-                except SchoolSection.DoesNotExist:
-                    logger.warning(f"Class with ID {class_assignment.class_instance.id} not found.")
-                    continue
                 students_data.append({
                     "student_id": student.student_id,
                     "student_name": user.full_name(),
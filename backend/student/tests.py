@@ -1,3 +1,66 @@
+from datetime import date
+
 from django.test import TestCase
 
-# Create your tests here.
+from core.models import User
+from academics.models import SchoolAcademicYear
+from classes.models import SchoolClass, SchoolSection
+from student.models import Student, StudentClassAssignment
+from student.services.student_service import StudentService
+
+SCHOOL_DB = 'school_test'
+
+
+class GetStudentsDataQueryTest(TestCase):
+    """The student list costs the same number of queries whatever its length."""
+
+    databases = {'default', SCHOOL_DB}
+
+    def setUp(self):
+        self.academic_year = SchoolAcademicYear.objects.using(SCHOOL_DB).create(
+            start_year=2025, end_year=2026)
+        school_class = SchoolClass.objects.using(SCHOOL_DB).create(class_number=5)
+        self.section = SchoolSection.objects.using(SCHOOL_DB).create(
+            class_instance=school_class, section='A')
+        self.student_count = 0
+
+    def add_students(self, count):
+        for _ in range(count):
+            self.student_count += 1
+            user = User.objects.create(user_name=f'student{self.student_count}',
+                                       email=f'student{self.student_count}@example.com',
+                                       first_name='Student', last_name=str(self.student_count))
+            student = Student.objects.using(SCHOOL_DB).create(
+                student_id=user.id,
+                roll_number=str(self.student_count),
+                admission_date=date(2025, 6, 1),
+                parent_name='Parent',
+                parent_phone='9999999999',
+                parent_email='parent@example.com',
+            )
+            StudentClassAssignment.objects.using(SCHOOL_DB).create(
+                student=student, class_instance=self.section, academic_year=self.academic_year)
+
+    def get_students_data(self):
+        students = Student.objects.using(SCHOOL_DB).all()
+        return StudentService(SCHOOL_DB).get_students_data(students, self.academic_year.id)
+
+    def assert_flat_query_count(self, student_count):
+        # School DB: academic year check + the joined assignment query; default DB: one user fetch
+        with self.assertNumQueries(2, using=SCHOOL_DB), self.assertNumQueries(1, using='default'):
+            students_data = self.get_students_data()
+        self.assertEqual(len(students_data), student_count)
+
+    def test_query_count_stays_flat_as_rows_grow(self):
+        self.add_students(3)
+        self.assert_flat_query_count(3)
+
+        self.add_students(20)
+        self.assert_flat_query_count(23)
+
+    def test_rows_carry_section_and_user(self):
+        self.add_students(1)
+        row = self.get_students_data()[0]
+        self.assertEqual(row['student_name'], 'Student 1')
+        self.assertEqual(row['class_id'], self.section.id)
+        self.assertEqual(row['section'], 'A')
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.3 on 2026-10-18 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def keep_only_section_changes(apps, schema_editor):
+    """
+    Classwise rows used to be full copies of the shared syllabus. Drop the
+    copies that match their shared row and turn the edited ones into overrides.
+    """
+    db_alias = schema_editor.connection.alias
+    SchoolSubTopic = apps.get_model('syllabus', 'SchoolSubTopic')
+    SchoolPrerequisite = apps.get_model('syllabus', 'SchoolPrerequisite')
+    SchoolClassSubTopic = apps.get_model('syllabus', 'SchoolClassSubTopic')
+    SchoolClassPrerequisite = apps.get_model('syllabus', 'SchoolClassPrerequisite')
+
+    sub_topics = {
+        (chapter_id, name): sub_topic_id
+        for sub_topic_id, chapter_id, name in SchoolSubTopic.objects.using(db_alias).values_list(
+            'id', 'chapter_id', 'name')
+    }
+    copies = [
+        class_sub_topic_id
+        for class_sub_topic_id, chapter_id, name in SchoolClassSubTopic.objects.using(
+            db_alias).values_list('id', 'chapter_id', 'name').iterator()
+        if (chapter_id, name) in sub_topics
+    ]
+    for start in range(0, len(copies), 1000):
+        SchoolClassSubTopic.objects.using(db_alias).filter(
+            id__in=copies[start:start + 1000]).delete()
+
+    prerequisites = {
+        (chapter_id, topic): (prerequisite_id, explanation)
+        for prerequisite_id, chapter_id, topic, explanation in SchoolPrerequisite.objects.using(
+            db_alias).values_list('id', 'chapter_id', 'topic', 'explanation')
+    }
+    copies = []
+    overrides = []
+    overridden = set()
+    for class_prerequisite in SchoolClassPrerequisite.objects.using(db_alias).only(
+            'id', 'chapter_id', 'class_section_id', 'topic', 'explanation').order_by('id').iterator():
+        base = prerequisites.get((class_prerequisite.chapter_id, class_prerequisite.topic))
+        if base is None:
+            continue
+        key = (class_prerequisite.class_section_id, base[0])
+        if base[1] == class_prerequisite.explanation or key in overridden:
+            copies.append(class_prerequisite.id)
+        else:
+            class_prerequisite.base_id = base[0]
+            overrides.append(class_prerequisite)
+            overridden.add(key)
+    for start in range(0, len(copies), 1000):
+        SchoolClassPrerequisite.objects.using(db_alias).filter(
+            id__in=copies[start:start + 1000]).delete()
+    SchoolClassPrerequisite.objects.using(db_alias).bulk_update(
+        overrides, ['base'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    # Postgres refuses ALTER TABLE on a table with pending deferred FK trigger events,
+    # so the data rewrite commits before the unique constraints are added
+    atomic = False
+
+    dependencies = [
+        ('syllabus', '0005_remove_schoolclassprerequisite_unique_chapter_topic_section_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schoolclassprerequisite',
+            name='base',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='section_overrides', to='syllabus.schoolprerequisite'),
+        ),
+        migrations.AddField(
+            model_name='schoolclassprerequisite',
+            name='is_hidden',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='schoolclasssubtopic',
+            name='base',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='section_overrides', to='syllabus.schoolsubtopic'),
+        ),
+        migrations.AddField(
+            model_name='schoolclasssubtopic',
+            name='is_hidden',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(keep_only_section_changes, migrations.RunPython.noop, atomic=True),
+        migrations.AddConstraint(
+            model_name='schoolclassprerequisite',
+            constraint=models.UniqueConstraint(fields=('class_section', 'base'), name='unique_section_prerequisite_override'),
+        ),
+        migrations.AddConstraint(
+            model_name='schoolclasssubtopic',
+            constraint=models.UniqueConstraint(fields=('class_section', 'base'), name='unique_section_sub_topic_override'),
+        ),
+    ]
@@ -31,17 +31,36 @@ class SchoolPrerequisite(AbstractPrerequisite):
         db_table = 'syllabus_prerequisite'
         unique_together = ('chapter', 'topic')
 
+# Classwise rows only hold what a section changes on top of the shared syllabus:
+# with `base` set they override (or hide) that shared row for the section,
+# without it they are topics added for that section only.
+# See ClasswiseSyllabusResolver.
+
 class SchoolClassSubTopic(AbstractSubTopic):
     chapter = models.ForeignKey(SchoolChapter, on_delete=models.CASCADE)
     class_section = models.ForeignKey(SchoolSection, on_delete=models.CASCADE,
                                       null=True, blank=True)
+    base = models.ForeignKey(SchoolSubTopic, on_delete=models.CASCADE,
+                             null=True, blank=True, related_name='section_overrides')
+    is_hidden = models.BooleanField(default=False)
     class Meta(AbstractSubTopic.Meta):
         db_table = 'classwise_sub_topic'
+        constraints = [
+            models.UniqueConstraint(fields=['class_section', 'base'],
+                                    name='unique_section_sub_topic_override')
+        ]
 
 class SchoolClassPrerequisite(AbstractPrerequisite):
     chapter = models.ForeignKey(SchoolChapter, on_delete=models.CASCADE,
                                 )
     class_section = models.ForeignKey(SchoolSection, on_delete=models.CASCADE,
                                       null=True, blank=True)
+    base = models.ForeignKey(SchoolPrerequisite, on_delete=models.CASCADE,
+                             null=True, blank=True, related_name='section_overrides')
+    is_hidden = models.BooleanField(default=False)
     class Meta(AbstractPrerequisite.Meta):
         db_table = 'classwise_prerequisite'
+        constraints = [
+            models.UniqueConstraint(fields=['class_section', 'base'],
+                                    name='unique_section_prerequisite_override')
+        ]
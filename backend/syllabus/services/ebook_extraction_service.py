@@ -0,0 +1,180 @@
+"""Ebook extraction service module"""
+
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from rest_framework.response import Response
+from rest_framework import status
+
+from school.models import Chapter, Prerequisite, SubTopic, SchoolSyllabusEbooks
+from core.lang_chain.lang_chain import LangChainService
+from syllabus.services.ebook_text_service import EbookTextService
+
+logger = logging.getLogger(__name__)
+
+
+class EbookExtractionService:
+    """
+    Extract the chapters, sub topics and prerequisites of uploaded eBooks in the background.
+
+    The extraction state lives on SchoolSyllabusEbooks (`extraction_status`).
+    A worker claims a pending eBook, reads its stored text (the PDF is only
+    downloaded and parsed the first time, see EbookTextService), calls the LLM
+    with no transaction open, and only then writes the chapters in one short
+    transaction. Failed extractions are retried up to MAX_ATTEMPTS.
+    """
+
+    BATCH_SIZE = 1000
+
+    def enqueue(self, ebook):
+        """Mark an eBook for extraction and start it once the surrounding transaction commits."""
+        SchoolSyllabusEbooks.objects.filter(pk=ebook.pk).update(
+            extraction_status='pending', extraction_attempts=0, extraction_error=None)
+        ebook.extraction_status = 'pending'
+        if settings.EXTRACTION_CONFIG['RUN_IN_PROCESS']:
+            transaction.on_commit(lambda: self.start_in_background(ebook.pk))
+
+    def start_in_background(self, ebook_id):
+        """Run an extraction on a daemon thread of this worker."""
+        thread = threading.Thread(target=self.run_by_id, args=(ebook_id,), daemon=True,
+                                  name=f"ebook-extraction-{ebook_id}")
+        thread.start()
+
+    def run_by_id(self, ebook_id):
+        try:
+            ebook = self.claim(ebook_id=ebook_id)
+            if ebook:
+                self.run(ebook)
+        finally:
+            connections.close_all()
+
+    def claim(self, ebook_id=None):
+        """
+        Claim the next eBook to extract (or a specific one) for this worker.
+        Extractions left 'running' by a worker that died are reclaimed after a lease timeout.
+        """
+        stale_before = timezone.now() - timedelta(
+            seconds=settings.EXTRACTION_CONFIG['LEASE_SECONDS'])
+        with transaction.atomic():
+            ebooks = SchoolSyllabusEbooks.objects.select_for_update(skip_locked=True).filter(
+                Q(extraction_status='pending') |
+                Q(extraction_status='running', extraction_started_at__lt=stale_before)
+            )
+            if ebook_id is not None:
+                ebooks = ebooks.filter(pk=ebook_id)
+            ebook = ebooks.order_by('updated_at').first()
+            if not ebook:
+                return None
+            ebook.extraction_status = 'running'
+            ebook.extraction_attempts += 1
+            ebook.extraction_started_at = timezone.now()
+            ebook.save(update_fields=['extraction_status', 'extraction_attempts',
+                                      'extraction_started_at', 'updated_at'])
+            return ebook
+
+    def run(self, ebook):
+        """Extract a claimed eBook and store its chapters."""
+        logger.info(f"Extracting eBook {ebook.id} (attempt {ebook.extraction_attempts})")
+        try:
+            chapters = self.extract(ebook)
+            self.save_chapters(ebook, chapters)
+            ebook.extraction_status = 'done'
+            ebook.extraction_error = None
+            logger.info(f"Extracted {len(chapters)} chapters from eBook {ebook.id}.")
+        except Exception as e:
+            logger.exception(f"Extraction failed for eBook {ebook.id}: {e}")
+            retry = ebook.extraction_attempts < settings.EXTRACTION_CONFIG['MAX_ATTEMPTS']
+            ebook.extraction_status = 'pending' if retry else 'failed'
+            ebook.extraction_error = str(e)
+        ebook.save(update_fields=['extraction_status', 'extraction_error', 'updated_at'])
+        if ebook.extraction_status == 'pending' and settings.EXTRACTION_CONFIG['RUN_IN_PROCESS']:
+            self.schedule_retry(ebook)
+        return ebook
+
+    def schedule_retry(self, ebook):
+        """
+        Extract a failed eBook again on this worker after an exponential backoff.
+        If the process exits first, the pending eBook waits for a `run_ebook_extraction` worker.
+        """
+        delay = settings.EXTRACTION_CONFIG['RETRY_DELAY_SECONDS'] * 2 ** (ebook.extraction_attempts - 1)
+        logger.info(f"Retrying extraction of eBook {ebook.id} in {delay}s")
+        timer = threading.Timer(delay, self.start_in_background, args=(ebook.id,))
+        timer.daemon = True
+        timer.start()
+
+    def extract(self, ebook):
+        """Run the LLM extraction on the eBook's text, parsing the PDF from S3 only the first time."""
+        pages = EbookTextService().get_or_extract_pages(ebook)
+        lang_chain_service = LangChainService()
+        chapters = lang_chain_service.get_topics_and_prerequisites_from_pages(pages)
+        report = lang_chain_service.normalization_report
+        if report:
+            logger.info(f"eBook {ebook.id}: normalization saved {report.tokens_saved} of "
+                        f"{report.tokens_before} prompt tokens ({report.saved_ratio:.0%}).")
+        return chapters
+
+    def save_chapters(self, ebook, chapters_obj):
+        """Replace the chapters of an eBook in one short transaction."""
+        with transaction.atomic():
+            Chapter.objects.filter(ebook=ebook).delete()
+            chapters = Chapter.objects.bulk_create([
+                Chapter(
+                    chapter_number=chapter_item['chapter_number'],
+                    ebook=ebook,
+                    chapter_name=chapter_item['chapter_name']
+                )
+                for chapter_item in chapters_obj
+            ], batch_size=self.BATCH_SIZE)
+            SubTopic.objects.bulk_create([
+                SubTopic(chapter=chapter, name=sub_topic)
+                for chapter_item, chapter in zip(chapters_obj, chapters)
+                for sub_topic in chapter_item['sub_topics']
+            ], batch_size=self.BATCH_SIZE)
+            Prerequisite.objects.bulk_create([
+                Prerequisite(
+                    chapter=chapter,
+                    topic=prerequisite['topic'],
+                    explanation=prerequisite['explanation']
+                )
+                for chapter_item, chapter in zip(chapters_obj, chapters)
+                for prerequisite in chapter_item['pre_requisites']
+            ], batch_size=self.BATCH_SIZE)
+        return True
+
+    def get_extraction_status(self, request):
+        """
+        Get the extraction status of an eBook.
+        Args:
+            request: The HTTP request containing the eBook ID.
+        Returns:
+            Response: A response with the extraction status.
+        """
+        try:
+            ebook_id = request.query_params.get('ebook_id')
+            if not ebook_id:
+                return Response({"error": "eBook ID is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+            ebook = SchoolSyllabusEbooks.objects.get(id=ebook_id)
+            data = {
+                "ebook_id": ebook.id,
+                "ebook_name": ebook.ebook_name,
+                "extraction_status": ebook.extraction_status,
+                "attempts": ebook.extraction_attempts,
+                "error": ebook.extraction_error,
+                "chapter_count": Chapter.objects.filter(ebook=ebook).count()
+                                 if ebook.extraction_status == 'done' else 0,
+                "updated_at": ebook.updated_at,
+            }
+            return Response({"data": data}, status=status.HTTP_200_OK)
+        except SchoolSyllabusEbooks.DoesNotExist:
+            return Response({"error": "eBook not found."}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.exception(f"Error fetching extraction status: {e}")
+            return Response({"error": "An error occurred while fetching the extraction status."},
+                            status=status.HTTP_500_INTERNAL_SERVER_ERROR)
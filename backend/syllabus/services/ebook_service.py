@@ -1,7 +1,7 @@
 """Ebook Service Module"""
 
+import hashlib
 import logging
-from io import BytesIO
 from django.db import transaction
 
 from rest_framework.response import Response
@@ -22,7 +22,10 @@ from syllabus.models import SchoolChapter,SchoolSubTopic, SchoolPrerequisite
 from classes.models import SchoolClass
 from core import s3_client
 from core.common_modules.aws_s3_bucket import AwsS3Bucket
-from core.lang_chain.lang_chain import LangChainService
+from core.common_modules.db_loader import DbLoader
+from core.common_modules.pagination import KeysetPaginator, InvalidCursor
+from syllabus.services.ebook_extraction_service import EbookExtractionService
+from syllabus.services.ebook_text_service import EbookTextService
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,10 @@ logger = logging.getLogger(__name__)
 class EbookService:
     """Service class to handle eBook operations."""
 
+    # Rows per INSERT when copying the syllabus into a school database
+    COPY_BATCH_SIZE = 1000
+    EBOOK_PAGE_SIZE = 10
+
     def upload_ebook(self, request):
         """Upload an eBook to S3."""
         try:
@@ -54,15 +61,30 @@ class EbookService:
 
             if upload_type == 'chapter_wise':
                 file_name = f"{subject_obj.name}_chapter_{chapter_number}"
-                s3_key = f"ebooks/class_{class_obj.class_number}/{board_obj.board_name.replace(' ', '_')}/{subject_obj.name}/{file_name}"
             else:
                 file_name = subject_obj.name
-                s3_key = f"ebooks/class_{class_obj.class_number}/{board_obj.board_name.replace(' ', '_')}/{file_name}"
 
             file_type = 'application/pdf'
-            file_bytes = file.read()
-            upload_success = s3_client.upload_file(BytesIO(file_bytes), s3_key, file_type=file_type)
+            content_hash = self.hash_upload(file)
+            s3_key = f"ebooks/sha256/{content_hash[:2]}/{content_hash}.pdf"
+
+            # Identical content uploaded before (any board/class/subject): reuse its object
+            source_ebook = SchoolSyllabusEbooks.objects.filter(
+                content_hash=content_hash).order_by('id').first()
+            if source_ebook:
+                logger.info(f"eBook content {content_hash} already stored, skipping S3 upload.")
+                upload_success = True
+            else:
+                file.seek(0)
+                upload_success = s3_client.upload_file(file, s3_key, file_type=file_type)
+
             if upload_success:
+                previous_path, previous_hash = SchoolSyllabusEbooks.objects.filter(
+                    board=board_obj,
+                    subject=subject_obj,
+                    class_number=class_obj,
+                    ebook_name=file_name,
+                ).values_list('file_path', 'content_hash').first() or (None, None)
                 with transaction.atomic():
                     ebook, created = SchoolSyllabusEbooks.objects.update_or_create(
                         board=board_obj,
@@ -70,10 +92,31 @@ class EbookService:
                         class_number=class_obj,
                         ebook_type=upload_type,
                         ebook_name=file_name,
-                        defaults={"file_path": s3_key}
+                        defaults={"file_path": s3_key, "content_hash": content_hash}
                     )
-                    self.extract_topics_and_prerequisites(BytesIO(file_bytes), ebook)
-                return Response({"message": "eBook uploaded successfully"}, status=status.HTTP_201_CREATED)
+                    if source_ebook and source_ebook.extraction_status == 'done':
+                        if source_ebook.id == ebook.id:
+                            logger.info(f"eBook {ebook.id} re-submitted unchanged, keeping its syllabus.")
+                        else:
+                            self.copy_extracted_syllabus(source_ebook, ebook)
+                            SchoolSyllabusEbooks.objects.filter(pk=ebook.pk).update(
+                                extraction_status='done', extraction_error=None)
+                            ebook.extraction_status = 'done'
+                    elif not (source_ebook and source_ebook.id == ebook.id
+                              and source_ebook.extraction_status in ('pending', 'running')):
+                        # The LLM call runs in the background, outside any transaction
+                        EbookExtractionService().enqueue(ebook)
+                if previous_path and previous_path != s3_key:
+                    self.delete_unreferenced_file(previous_path)
+                    EbookTextService.delete_unreferenced(previous_hash)
+                if ebook.extraction_status == 'done':
+                    return Response({"message": "eBook uploaded successfully",
+                                     "ebook_id": ebook.id, "extraction_status": "done"},
+                                    status=status.HTTP_201_CREATED)
+                return Response({"message": "eBook uploaded, extraction in progress.",
+                                 "ebook_id": ebook.id,
+                                 "extraction_status": ebook.extraction_status},
+                                status=status.HTTP_202_ACCEPTED)
             else:
                 return Response({"error": "Failed to upload eBook."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         except SchoolBoard.DoesNotExist:
@@ -96,10 +139,9 @@ class EbookService:
             board_id = request.GET.get("board_id")
             class_id = request.GET.get("class_id")
             subject_id = request.GET.get("subject_id")
-            page = int(request.GET.get("page", 1))
+            cursor = request.GET.get("cursor")
 
             filter_conditions = {}
-            page_size = 10
             if board_id:
                 board = SchoolBoard.objects.get(id=board_id)
                 filter_conditions['board'] = board
@@ -112,10 +154,22 @@ class EbookService:
                 subject = SchoolDefaultSubjects.objects.all()
             filter_conditions['subject__in'] = subject
 
-            ebooks_obj = SchoolSyllabusEbooks.objects.filter(**filter_conditions)
-            ebooks = ebooks_obj.order_by('id')[(page - 1) * page_size: page * page_size]
-            if ebooks_obj and not ebooks:
-                return Response({"message": "End of ebooks.",'data':[]}, status=status.HTTP_200_OK)
+            ebooks_obj = SchoolSyllabusEbooks.objects.filter(**filter_conditions).select_related(
+                'board', 'subject', 'class_number')
+            paginator = KeysetPaginator.from_request(request, default_page_size=self.EBOOK_PAGE_SIZE)
+            if paginator.unbounded:
+                # Clients that don't send a cursor still page with `page`
+                page = int(request.GET.get("page", 1))
+                ebooks = list(ebooks_obj.order_by('id')[
+                    (page - 1) * self.EBOOK_PAGE_SIZE: page * self.EBOOK_PAGE_SIZE])
+                next_cursor = None
+                if not ebooks and ebooks_obj.exists():
+                    return Response({"message": "End of ebooks.",'data':[]}, status=status.HTTP_200_OK)
+            else:
+                ebooks, next_cursor = paginator.paginate(ebooks_obj)
+            if cursor and not ebooks:
+                return Response({"message": "End of ebooks.",'data':[], 'next_cursor': None},
+                                status=status.HTTP_200_OK)
             if not ebooks:
                 return Response({"error": "No eBooks found for the given criteria."},
                                 status=status.HTTP_404_NOT_FOUND)
@@ -130,11 +184,15 @@ class EbookService:
                     "class_number": ebook.class_number.class_number,
                     "ebook_name": ebook.ebook_name,
                     "ebook_type": ebook.ebook_type,
+                    "extraction_status": ebook.extraction_status,
                     "uploaded_at": ebook.created_at.strftime("%Y-%m-%d %H:%M:%S"),
                 })
 
             logger.info(f"Retrieved Ebooks Successfully.")
-            return Response({'data': ebook_list}, status=status.HTTP_200_OK)
+            return Response({'data': ebook_list, 'next_cursor': next_cursor},
+                            status=status.HTTP_200_OK)
+        except InvalidCursor as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except SchoolBoard.DoesNotExist:
             return Response({"error": "Board not found."}, status=status.HTTP_404_NOT_FOUND)
         except SchoolDefaultClasses.DoesNotExist:
@@ -155,8 +213,9 @@ class EbookService:
                                 status=status.HTTP_400_BAD_REQUEST)
 
             ebook = SchoolSyllabusEbooks.objects.get(id=ebook_id)
-            s3_client.delete_file(ebook.file_path)
             ebook.delete()
+            self.delete_unreferenced_file(ebook.file_path)
+            EbookTextService.delete_unreferenced(ebook.content_hash)
 
             logger.info("eBook with ID %s deleted successfully.",ebook_id)
             return Response({"message": "eBook deleted successfully."}, status=status.HTTP_200_OK)
@@ -167,73 +226,110 @@ class EbookService:
             return Response({"error": "An error occurred while deleting the eBook."},
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def extract_topics_and_prerequisites(self, pdf_file, ebook):
-        """Extract topics and prerequisites from the provided PDF file."""
+    @staticmethod
+    def hash_upload(file):
+        """Return the SHA-256 of an uploaded file, read chunk by chunk."""
+        digest = hashlib.sha256()
+        for chunk in file.chunks():
+            digest.update(chunk)
+        return digest.hexdigest()
 
-        lang_chain_service = LangChainService()
-        chapters_obj = lang_chain_service.get_topics_and_prerequisites(pdf_file)
+    @staticmethod
+    def delete_unreferenced_file(s3_key):
+        """Delete an S3 object once no eBook points to it anymore."""
+        if SchoolSyllabusEbooks.objects.filter(file_path=s3_key).exists():
+            logger.info(f"S3 object {s3_key} is still used by another eBook, keeping it.")
+            return False
+        return s3_client.delete_file(s3_key)
+
+    def copy_extracted_syllabus(self, source_ebook, ebook):
+        """Give `ebook` the chapters already extracted from identical content."""
+        source_chapters = list(Chapter.objects.filter(ebook=source_ebook).prefetch_related(
+            'sub_topics', 'prerequisites'))
         with transaction.atomic():
             Chapter.objects.filter(ebook=ebook).delete()
-            for chapter_item in chapters_obj:
-                chapter = Chapter.objects.create(
-                    chapter_number=chapter_item['chapter_number'],
-                    ebook=ebook,
-                    chapter_name=chapter_item['chapter_name']
-                )
-
-                for sub_topic in chapter_item['sub_topics']:
-                    sub_topic_obj = SubTopic.objects.create(
-                        chapter=chapter,
-                        name=sub_topic
-                    )
-                    
-                for prerequisite in chapter_item['pre_requisites']:
-                    prerequisite_obj = Prerequisite.objects.create(
-                        chapter=chapter,
-                        topic=prerequisite['topic'],
-                        explanation=prerequisite['explanation']
-                    )
-        
+            chapters = Chapter.objects.bulk_create([
+                Chapter(chapter_number=chapter.chapter_number,
+                        chapter_name=chapter.chapter_name,
+                        ebook=ebook)
+                for chapter in source_chapters
+            ])
+            SubTopic.objects.bulk_create([
+                SubTopic(chapter=chapter, name=sub_topic.name)
+                for source, chapter in zip(source_chapters, chapters)
+                for sub_topic in source.sub_topics.all()
+            ], batch_size=self.COPY_BATCH_SIZE)
+            Prerequisite.objects.bulk_create([
+                Prerequisite(chapter=chapter, topic=prerequisite.topic,
+                             explanation=prerequisite.explanation)
+                for source, chapter in zip(source_chapters, chapters)
+                for prerequisite in source.prerequisites.all()
+            ], batch_size=self.COPY_BATCH_SIZE)
+        logger.info(f"Reused {len(chapters)} extracted chapters of eBook {source_ebook.id} "
+                    f"for eBook {ebook.id}.")
         return True
-    
+
     def copy_syllabus_data_to_school_db(self,school_db_metadata,academic_year_id):
+        """
+        Copy the central syllabus of the school's boards into its database.
+        The syllabus is read with three queries (chapters, sub topics,
+        prerequisites) and written with batched bulk inserts.
+        """
         try:
-            school_db_name = school_db_metadata.db_name
-            
+            school_db_name = DbLoader().register_school_database(school_db_metadata.db_name)
+
+            board_ids = list(SchoolBoardMapping.objects.filter(
+                school_id = school_db_metadata.school_id
+            ).values_list('board_id', flat=True))
+            chapters = list(Chapter.objects.filter(
+                ebook__board_id__in=board_ids
+            ).select_related('ebook').prefetch_related('sub_topics', 'prerequisites'))
+
+            class_ids = dict(SchoolClass.objects.using(school_db_name).values_list('class_number', 'id'))
+            school_chapters = []
+            for chapter in chapters:
+                class_number = chapter.ebook.class_number_id
+                if class_number not in class_ids:
+                    raise SchoolClass.DoesNotExist(f"Class {class_number} not found in {school_db_name}.")
+                school_chapters.append(SchoolChapter(
+                    school_board_id=chapter.ebook.board_id,
+                    academic_year_id=academic_year_id,
+                    class_number_id=class_ids[class_number],
+                    subject_id=chapter.ebook.subject_id,
+                    chapter_number=chapter.chapter_number,
+                    chapter_name=chapter.chapter_name
+                ))
+
             with transaction.atomic(using=school_db_name):
-                boards = SchoolBoardMapping.objects.filter(school_id = school_db_metadata.school_id)
-                for board in boards:
-                    ebooks = SchoolSyllabusEbooks.objects.filter(board_id = board.board_id).select_related('class_number', 'subject')
-                    for ebook in ebooks:
-                        chapters = Chapter.objects.filter(ebook=ebook)
-                        for chapter in chapters:
-                            school_class_obj = SchoolClass.objects.using(school_db_name).get(
-                                class_number=ebook.class_number_id
-                            )
-                            school_chapter_obj = SchoolChapter.objects.using(school_db_name).create(
-                                school_board_id=board.board_id,
-                                academic_year_id=academic_year_id,
-                                class_number=school_class_obj,
-                                subject_id=ebook.subject_id,
-                                chapter_number=chapter.chapter_number,
-                                chapter_name=chapter.chapter_name
-                            )
-                            sub_topics = SubTopic.objects.filter(chapter=chapter)
-                            for sub_topic in sub_topics:
-                                SchoolSubTopic.objects.using(school_db_name).create(
-                                    chapter=school_chapter_obj,
-                                    name=sub_topic.name
-                                )
-                            prerequisites = Prerequisite.objects.filter(chapter=chapter)
-                            for prerequisite in prerequisites:
-                                SchoolPrerequisite.objects.using(school_db_name).create(
-                                    chapter=school_chapter_obj,
-                                    topic=prerequisite.topic,
-                                    explanation=prerequisite.explanation
-                                )
-                    logger.info(f"Syllabus data for board {board.board_id} copied to school DB {school_db_name} successfully.")
-            logger.info(f"Syllabus data copied to school DB {school_db_name} successfully.")
+                school_chapters = SchoolChapter.objects.using(school_db_name).bulk_create(
+                    school_chapters, batch_size=self.COPY_BATCH_SIZE)
+
+                sub_topics = []
+                prerequisites = []
+                for chapter, school_chapter in zip(chapters, school_chapters):
+                    sub_topics.extend(
+                        SchoolSubTopic(chapter=school_chapter, name=sub_topic.name)
+                        for sub_topic in chapter.sub_topics.all()
+                    )
+                    prerequisites.extend(
+                        SchoolPrerequisite(
+                            chapter=school_chapter,
+                            topic=prerequisite.topic,
+                            explanation=prerequisite.explanation
+                        )
+                        for prerequisite in chapter.prerequisites.all()
+                    )
+                SchoolSubTopic.objects.using(school_db_name).bulk_create(
+                    sub_topics, batch_size=self.COPY_BATCH_SIZE)
+                SchoolPrerequisite.objects.using(school_db_name).bulk_create(
+                    prerequisites, batch_size=self.COPY_BATCH_SIZE)
+
+            logger.info(
+                f"Syllabus data copied to school DB {school_db_name} successfully: "
+                f"{len(school_chapters)} chapters, {len(sub_topics)} sub topics, "
+                f"{len(prerequisites)} prerequisites."
+            )
             return True
         except Exception as e:
-            logger.error(f"Error copying syllabus data to school DB {school_db_name}: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error(f"Error copying syllabus data to school DB {school_db_metadata.db_name}: {str(e)}")
+            return False
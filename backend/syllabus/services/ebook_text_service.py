@@ -0,0 +1,113 @@
+"""Ebook text service module"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import zlib
+
+from django.db import IntegrityError
+
+from school.models import EbookText, SchoolSyllabusEbooks
+from core import s3_client
+from core.common_modules.pdf_text_extractor import PdfTextExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class EbookTextService:
+    """
+    Keep the extracted page text of eBooks so a PDF is parsed once.
+
+    The text is stored per content hash (see SchoolSyllabusEbooks.content_hash),
+    zlib-compressed, with the start offset of every page. Re-extractions,
+    prompt changes and identical uploads read it back instead of downloading
+    and parsing the PDF again.
+    """
+
+    COMPRESSION_LEVEL = 6
+
+    def get_pages(self, content_hash):
+        """Return the stored page texts for a content hash, or None."""
+        text = EbookText.objects.filter(content_hash=content_hash).first()
+        if text is None:
+            return None
+        return self.unpack(text)
+
+    def get_or_extract_pages(self, ebook):
+        """Return the page texts of an eBook, parsing its PDF from S3 only when not stored yet."""
+        if ebook.content_hash:
+            pages = self.get_pages(ebook.content_hash)
+            if pages is not None:
+                logger.info(f"Using stored text of eBook {ebook.id} ({len(pages)} pages).")
+                return pages
+
+        fd, path = tempfile.mkstemp(suffix='.pdf')
+        os.close(fd)
+        try:
+            if not s3_client.download_file(ebook.file_path, path):
+                raise Exception(f"Could not download {ebook.file_path} from S3.")
+            if not ebook.content_hash:
+                # Uploaded before content hashing
+                ebook.content_hash = self.hash_file(path)
+                SchoolSyllabusEbooks.objects.filter(pk=ebook.pk).update(
+                    content_hash=ebook.content_hash)
+            extractor = PdfTextExtractor()
+            pages = extractor.extract_pages(path)
+        finally:
+            os.remove(path)
+
+        self.save_pages(ebook.content_hash, pages, extractor.parser_name)
+        return pages
+
+    def save_pages(self, content_hash, pages, parser):
+        """Store the page texts of a PDF, replacing any previous extraction."""
+        offsets = []
+        position = 0
+        for page in pages:
+            offsets.append(position)
+            position += len(page)
+        text = "".join(pages)
+        compressed = zlib.compress(text.encode('utf-8'), self.COMPRESSION_LEVEL)
+
+        try:
+            EbookText.objects.update_or_create(
+                content_hash=content_hash,
+                defaults={
+                    'parser': parser,
+                    'page_count': len(pages),
+                    'char_count': len(text),
+                    'page_offsets': offsets,
+                    'compressed_text': compressed,
+                }
+            )
+        except IntegrityError:
+            # Stored concurrently by another worker
+            return
+        logger.info(f"Stored text of {content_hash}: {len(pages)} pages, "
+                    f"{len(text)} chars in {len(compressed)} bytes.")
+
+    @staticmethod
+    def unpack(ebook_text):
+        text = zlib.decompress(bytes(ebook_text.compressed_text)).decode('utf-8')
+        offsets = ebook_text.page_offsets
+        return [
+            text[start:offsets[index + 1] if index + 1 < len(offsets) else len(text)]
+            for index, start in enumerate(offsets)
+        ]
+
+    @staticmethod
+    def delete_unreferenced(content_hash):
+        """Delete the stored text once no eBook has this content anymore."""
+        if not content_hash or SchoolSyllabusEbooks.objects.filter(content_hash=content_hash).exists():
+            return False
+        EbookText.objects.filter(content_hash=content_hash).delete()
+        return True
+
+    @staticmethod
+    def hash_file(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as pdf_file:
+            for chunk in iter(lambda: pdf_file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
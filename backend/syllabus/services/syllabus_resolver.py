@@ -0,0 +1,99 @@
+"""Syllabus resolver module for reading a section's syllabus through its overlay."""
+
+import logging
+
+from syllabus.models import (
+    SchoolSubTopic,
+    SchoolPrerequisite,
+    SchoolClassSubTopic,
+    SchoolClassPrerequisite
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ClasswiseSyllabusResolver:
+    """
+    Merge the shared syllabus of a school with the changes of one section.
+
+    Sections don't get a copy of the sub topics and prerequisites of their
+    chapters. They read the shared SchoolSubTopic/SchoolPrerequisite rows, and
+    the classwise tables only store the section's overrides (`base` set),
+    hidden topics (`is_hidden`) and section-only additions (no `base`).
+    """
+
+    SUB_TOPIC_FIELDS = ('name',)
+    PREREQUISITE_FIELDS = ('topic', 'explanation')
+
+    def __init__(self, school_db_name):
+        self.school_db_name = school_db_name
+
+    def get_sub_topics(self, section_id, chapter_ids):
+        """Return {chapter_id: [sub topic dicts]} as seen by the section."""
+        return self._resolve(SchoolSubTopic, SchoolClassSubTopic, self.SUB_TOPIC_FIELDS,
+                             section_id, chapter_ids)
+
+    def get_prerequisites(self, section_id, chapter_ids):
+        """Return {chapter_id: [prerequisite dicts]} as seen by the section."""
+        return self._resolve(SchoolPrerequisite, SchoolClassPrerequisite, self.PREREQUISITE_FIELDS,
+                             section_id, chapter_ids)
+
+    def _resolve(self, base_model, overlay_model, fields, section_id, chapter_ids):
+        chapter_ids = list(chapter_ids)
+        base_rows = base_model.objects.using(self.school_db_name).filter(
+            chapter_id__in=chapter_ids
+        ).values('id', 'chapter_id', *fields)
+        overlay_rows = overlay_model.objects.using(self.school_db_name).filter(
+            class_section_id=section_id,
+            chapter_id__in=chapter_ids
+        ).values('id', 'chapter_id', 'base_id', 'is_hidden', *fields)
+
+        overrides = {}
+        additions = []
+        for row in overlay_rows:
+            if row['base_id'] is None:
+                additions.append(row)
+            else:
+                overrides[row['base_id']] = row
+
+        resolved = {chapter_id: [] for chapter_id in chapter_ids}
+        for row in base_rows:
+            override = overrides.get(row['id'])
+            if override and override['is_hidden']:
+                continue
+            source = override or row
+            resolved.setdefault(row['chapter_id'], []).append({
+                'id': row['id'],
+                **{field: source[field] for field in fields},
+                'is_section_specific': override is not None,
+            })
+        for row in additions:
+            if row['is_hidden']:
+                continue
+            resolved.setdefault(row['chapter_id'], []).append({
+                'id': None,
+                'section_topic_id': row['id'],
+                **{field: row[field] for field in fields},
+                'is_section_specific': True,
+            })
+        return resolved
+
+    def override_sub_topic(self, section_id, sub_topic, **changes):
+        """Store a section's edit (or `is_hidden=True`) of a shared sub topic."""
+        return self._override(SchoolClassSubTopic, self.SUB_TOPIC_FIELDS, section_id,
+                              sub_topic, changes)
+
+    def override_prerequisite(self, section_id, prerequisite, **changes):
+        """Store a section's edit (or `is_hidden=True`) of a shared prerequisite."""
+        return self._override(SchoolClassPrerequisite, self.PREREQUISITE_FIELDS, section_id,
+                              prerequisite, changes)
+
+    def _override(self, overlay_model, fields, section_id, base, changes):
+        defaults = {field: getattr(base, field) for field in fields}
+        defaults.update(changes)
+        overlay, _ = overlay_model.objects.using(self.school_db_name).update_or_create(
+            class_section_id=section_id,
+            base=base,
+            defaults={'chapter_id': base.chapter_id, **defaults},
+        )
+        return overlay
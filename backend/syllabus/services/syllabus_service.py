@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from syllabus.models import SchoolChapter, SchoolPrerequisite, SchoolSubTopic
+from syllabus.services.syllabus_resolver import ClasswiseSyllabusResolver
 from core.common_modules.common_functions import CommonFunctions
 logger = logging.getLogger(__name__)
 
@@ -12,13 +13,18 @@ class SyllabusService:
     """Service class for handling syllabus-related operations."""
     
     def get_chapters_progress(self, request):
-        """Fetch chapters by subject ID."""
+        """
+        Fetch chapters by subject ID.
+        With `section_id`, every chapter also lists its sub topics and
+        prerequisites as seen by that section (see ClasswiseSyllabusResolver).
+        """
         try:
             school_id = request.GET.get("school_id") or getattr(request.user, 'school_id', None)
             school_board_id = request.GET.get("school_board_id")
             academic_year_id = request.GET.get("academic_year_id", 1)
             class_number_id = request.GET.get("class_number_id")
             subject_id = request.GET.get('subject_id')
+            section_id = request.GET.get('section_id')
 
             if not school_id or not school_board_id or not academic_year_id or not class_number_id or not subject_id:
                 return Response({"error": "Missing required parameters."},
@@ -41,6 +47,16 @@ class SyllabusService:
                         "chapter_number": chapter.chapter_number,
                     })
 
+            if section_id and chapters_list:
+                # The section's view of the shared syllabus, with its own edits applied
+                resolver = ClasswiseSyllabusResolver(school_db_name)
+                chapter_ids = [chapter["chapter_id"] for chapter in chapters_list]
+                sub_topics = resolver.get_sub_topics(section_id, chapter_ids)
+                prerequisites = resolver.get_prerequisites(section_id, chapter_ids)
+                for chapter in chapters_list:
+                    chapter["sub_topics"] = sub_topics.get(chapter["chapter_id"], [])
+                    chapter["prerequisites"] = prerequisites.get(chapter["chapter_id"], [])
+
             return Response({"data": chapters_list},
                             status=status.HTTP_200_OK)
         
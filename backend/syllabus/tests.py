@@ -1,3 +1,78 @@
 from django.test import TestCase
 
-# Create your tests here.
+from academics.models import SchoolAcademicYear
+from classes.models import SchoolClass, SchoolSection
+from school.models import EbookText
+from syllabus.models import SchoolChapter, SchoolSubTopic, SchoolClassSubTopic
+from syllabus.services.ebook_text_service import EbookTextService
+from syllabus.services.syllabus_resolver import ClasswiseSyllabusResolver
+
+SCHOOL_DB = 'school_test'
+
+
+class ClasswiseSyllabusResolverTest(TestCase):
+
+    databases = {'default', SCHOOL_DB}
+
+    def setUp(self):
+        academic_year = SchoolAcademicYear.objects.using(SCHOOL_DB).create(
+            start_year=2025, end_year=2026)
+        school_class = SchoolClass.objects.using(SCHOOL_DB).create(class_number=5)
+        self.section = SchoolSection.objects.using(SCHOOL_DB).create(
+            class_instance=school_class, section='A')
+        self.other_section = SchoolSection.objects.using(SCHOOL_DB).create(
+            class_instance=school_class, section='B')
+        self.chapter = SchoolChapter.objects.using(SCHOOL_DB).create(
+            chapter_number=1, chapter_name='Motion', school_board_id=1,
+            academic_year=academic_year, class_number=school_class)
+        self.speed, self.velocity, self.graphs = [
+            SchoolSubTopic.objects.using(SCHOOL_DB).create(chapter=self.chapter, name=name)
+            for name in ('Speed', 'Velocity', 'Graphs')
+        ]
+        self.resolver = ClasswiseSyllabusResolver(SCHOOL_DB)
+
+    def names(self, section):
+        sub_topics = self.resolver.get_sub_topics(section.id, [self.chapter.id])
+        return sorted(sub_topic['name'] for sub_topic in sub_topics[self.chapter.id])
+
+    def test_section_without_changes_reads_the_shared_syllabus(self):
+        self.assertEqual(self.names(self.section), ['Graphs', 'Speed', 'Velocity'])
+
+    def test_overrides_hidden_topics_and_additions_apply_to_their_section_only(self):
+        self.resolver.override_sub_topic(self.section.id, self.speed, name='Speed and distance')
+        self.resolver.override_sub_topic(self.section.id, self.graphs, is_hidden=True)
+        SchoolClassSubTopic.objects.using(SCHOOL_DB).create(
+            chapter=self.chapter, class_section=self.section, name='Field trip')
+
+        self.assertEqual(self.names(self.section), ['Field trip', 'Speed and distance', 'Velocity'])
+        self.assertEqual(self.names(self.other_section), ['Graphs', 'Speed', 'Velocity'])
+
+    def test_overriding_twice_updates_the_same_row(self):
+        self.resolver.override_sub_topic(self.section.id, self.speed, name='Pace')
+        self.resolver.override_sub_topic(self.section.id, self.speed, name='Speed (revised)')
+        self.assertEqual(SchoolClassSubTopic.objects.using(SCHOOL_DB).count(), 1)
+        self.assertIn('Speed (revised)', self.names(self.section))
+
+
+class EbookTextServiceTest(TestCase):
+
+    CONTENT_HASH = 'a' * 64
+
+    def test_pages_round_trip(self):
+        pages = ["Chapter 1\nMotion", "", "Vélocité — ünïcode", "", "Last page\n"]
+        EbookTextService().save_pages(self.CONTENT_HASH, pages, 'pypdf2')
+
+        stored = EbookText.objects.get(content_hash=self.CONTENT_HASH)
+        self.assertEqual(stored.page_offsets, [0, 16, 16, 34, 34])
+        self.assertEqual(stored.char_count, sum(len(page) for page in pages))
+        self.assertEqual(EbookTextService().get_pages(self.CONTENT_HASH), pages)
+
+    def test_saving_again_replaces_the_pages(self):
+        service = EbookTextService()
+        service.save_pages(self.CONTENT_HASH, ["one", "two"], 'pypdf2')
+        service.save_pages(self.CONTENT_HASH, ["only"], 'pymupdf')
+        self.assertEqual(service.get_pages(self.CONTENT_HASH), ["only"])
+        self.assertEqual(EbookText.objects.get(content_hash=self.CONTENT_HASH).parser, 'pymupdf')
+
+    def test_missing_text_returns_none(self):
+        self.assertIsNone(EbookTextService().get_pages('b' * 64))
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from core.permissions import IsSuperAdmin,IsSuperAdminOrAdminOrTeacher
 from syllabus.services.ebook_service import EbookService
+from syllabus.services.ebook_extraction_service import EbookExtractionService
 from syllabus.services.syllabus_service import SyllabusService
 
 class EbookView(APIView):
@@ -18,6 +19,8 @@ class EbookView(APIView):
         """Handle GET requests for eBook actions."""
         if action == 'getEbooks':
             return EbookService().get_ebook(request)
+        if action == 'getExtractionStatus':
+            return EbookExtractionService().get_extraction_status(request)
         return Response({"message": f"GET request for action: {action}"})
 
     def post(self, request, action=None):
@@ -3,7 +3,8 @@ from django.db import models
 from classes.models import SchoolSection
 from academics.models import SchoolAcademicYear
 
-from core.models import User,AbstractSubject
+from core.models import AbstractSubject
+from core.common_modules.user_directory import UserDirectory
 
 class Subject(AbstractSubject):
     class Meta:
@@ -25,7 +26,7 @@ class Teacher(models.Model):
 
     @property
     def full_name(self):
-        user_instance = User.objects.filter(id=self.teacher_id).first()
+        user_instance = UserDirectory.current().get(self.teacher_id)
         if user_instance:
             return f"{user_instance.first_name} {user_instance.last_name}"
         return "Unknown Teacher"
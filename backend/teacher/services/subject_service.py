@@ -11,6 +11,7 @@ from rest_framework import status
 from teacher.models import Subject
 
 from core.common_modules.common_functions import CommonFunctions
+from core.common_modules.pagination import KeysetPaginator, InvalidCursor
 from school.models import SchoolDefaultSubjects
 
 logger = logging.getLogger(__name__)
@@ -67,8 +68,18 @@ class SubjectService:
                 subjects = Subject.objects.using(school_db_name).all()
             else:
                 subjects = SchoolDefaultSubjects.objects.all()
-            subjects = subjects.values('id', 'name')
-            return JsonResponse(list(subjects), safe=False, status=status.HTTP_200_OK)
+            if request.GET.get('search'):
+                subjects = subjects.filter(name__icontains=request.GET.get('search'))
+
+            paginator = KeysetPaginator.from_request(request, ordering=('name', 'id'))
+            subjects, next_cursor = paginator.paginate(subjects.values('id', 'name'))
+            # The body stays a plain list for existing clients; the cursor goes in a header
+            response = JsonResponse(subjects, safe=False, status=status.HTTP_200_OK)
+            if next_cursor:
+                response['X-Next-Cursor'] = next_cursor
+            return response
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             logger.error(f"Error fetching subjects: {e}")
             return JsonResponse({"error": "Failed to fetch subjects."},
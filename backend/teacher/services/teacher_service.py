@@ -16,8 +16,9 @@ from classes.models import SchoolClass, SchoolSection
 from core.models import Role, User
 from core.common_modules.password_validator import is_valid_password
 from core.common_modules.send_email import EmailService
-
-from school.models import SchoolDbMetadata
+from core.common_modules.common_functions import CommonFunctions
+from core.common_modules.user_directory import UserDirectory
+from core.common_modules.pagination import KeysetPaginator, InvalidCursor
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +71,10 @@ class TeacherService:
                 logger.error("Invalid password format.")
                 return JsonResponse({"error": "Password must be at least 8 characters long and contain at least one uppercase letter, one lowercase letter, one number, and one special character."}, status=400)
             
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
+            if not school_db_name:
+                logger.error(f"School with ID {school_id} does not exist or is inactive.")
+                return JsonResponse({"error": "School not found or school is inactive."}, status=404)
 
 
             with transaction.atomic(using='default'):
@@ -173,7 +177,10 @@ class TeacherService:
             if not school_id:
                 logger.error("School ID is required for editing teacher.")
                 return JsonResponse({"error": "School ID is required."}, status=400)
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
+            if not school_db_name:
+                logger.error(f"School with ID {school_id} does not exist or is inactive.")
+                return JsonResponse({"error": "School not found or school is inactive."}, status=404)
 
             if not teacher_id:
                 logger.error("Teacher ID is required for editing.")
@@ -292,7 +299,10 @@ class TeacherService:
                 logger.error("Academic Year ID is required for editing.")
                 return JsonResponse({"error": "Academic Year ID is required."}, status=400)
 
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
+            if not school_db_name:
+                logger.error(f"School with ID {school_id} does not exist or is inactive.")
+                return JsonResponse({"error": "School not found or school is inactive."}, status=404)
 
             try:
                 teacher = Teacher.objects.using(school_db_name).get(teacher_id=teacher_id)
@@ -369,7 +379,10 @@ class TeacherService:
             #     return JsonResponse({"error": "Academic Year ID is required."}, status=400)
             
 
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
+            if not school_db_name:
+                logger.error(f"School with ID {school_id} does not exist or is inactive.")
+                return JsonResponse({"error": "School not found or school is inactive."}, status=404)
 
             # acadamic_year = AcademicYear.objects.using(school_db_name
             #                     ).filter(id=academic_year_id).first()
@@ -378,12 +391,19 @@ class TeacherService:
             #     return JsonResponse({"error": "Academic Year not found."}, status=404)
 
             teachers = Teacher.objects.using(school_db_name).all()
+            is_active = request.GET.get('is_active')
+            if is_active is not None:
+                teachers = teachers.filter(is_active=is_active.lower() == 'true')
+
+            paginator = KeysetPaginator.from_request(request)
+            teachers, next_cursor = paginator.paginate(teachers)
             teacher_list = []
 
+            user_directory = UserDirectory.current()
+            user_directory.prefetch(teacher.teacher_id for teacher in teachers)
             for teacher in teachers:
-                try:
-                    user = User.objects.get(id=teacher.teacher_id, school_id=school_id)
-                except User.DoesNotExist:
+                user = user_directory.get(teacher.teacher_id)
+                if user is None or str(user.school_id) != str(school_id):
                     continue
 
                 # subject_assignments = TeacherSubjectAssignment.objects.using(school_db_name).filter(
@@ -415,7 +435,9 @@ class TeacherService:
                     'phone_number': user.phone_number,
                 })
 
-            return JsonResponse({"teachers": teacher_list}, status=200)
+            return JsonResponse({"teachers": teacher_list, "next_cursor": next_cursor}, status=200)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
         except Exception as e:
             logger.error("Error fetching teacher list: %s", e)
             return JsonResponse({"error": "An error occurred while fetching the teacher list."},
@@ -438,7 +460,10 @@ class TeacherService:
                 logger.error("School ID is required to delete a teacher.")
                 return JsonResponse({"error": "School ID is required."}, status=400)
 
-            school_db_name = SchoolDbMetadata.objects.filter(school_id=school_id).first().db_name
+            school_db_name = CommonFunctions.get_school_db_name(school_id)
+            if not school_db_name:
+                logger.error(f"School with ID {school_id} does not exist or is inactive.")
+                return JsonResponse({"error": "School not found or school is inactive."}, status=404)
 
             with transaction.atomic(using='default'):
                 with transaction.atomic(using=school_db_name):